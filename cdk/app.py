@@ -1,26 +1,54 @@
 #!/usr/bin/env python3
+"""CDK app entry point.
+
+Heavy imports (aws_cdk, constructs and the stack module) are deferred to
+build() so importing this module stays cheap. To list stacks without
+re-running synthesis, reuse a previous synth output:
+
+    cdk --app cdk.out ls
+"""
 import os
-import aws_cdk as cdk
-from transcribe_stack import TranscribeStack
-
-# Load .env from repo root if present
-try:
-    from dotenv import load_dotenv
-    from pathlib import Path
-    env_path = Path(__file__).resolve().parent.parent / ".env"
-    if env_path.exists():
-        load_dotenv(dotenv_path=str(env_path))
-except Exception:
-    pass
-
-app = cdk.App()
-TranscribeStack(
-    app,
-    "TranscribeServiceStack",
-    env=cdk.Environment(
-        account=os.getenv("CDK_DEFAULT_ACCOUNT"),
-        # Default region set to eu-west-1 to match ffmpeg layer ARN region; override via CDK_DEFAULT_REGION env var if desired.
-        region=os.getenv("CDK_DEFAULT_REGION", "eu-west-1"),
-    ),
-)
-app.synth()
+
+# Load the repo-root .env once per process (same guard as transcriber/config.py)
+if "AWS_LAMBDA_FUNCTION_NAME" not in os.environ and not os.environ.get("_DOTENV_LOADED"):
+    try:
+        from dotenv import load_dotenv
+        _dotenv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".env")
+        if os.path.isfile(_dotenv_path):
+            load_dotenv(_dotenv_path)
+    except Exception:
+        pass
+    os.environ["_DOTENV_LOADED"] = "1"
+
+STACK_ID = "TranscribeServiceStack"
+
+
+def _selected_stacks() -> set[str] | None:
+    """Return stack ids requested via CDK_STACKS (comma-separated), or None for all."""
+    raw = os.getenv("CDK_STACKS", "")
+    names = {s.strip() for s in raw.split(",") if s.strip()}
+    return names or None
+
+
+def build():
+    """Construct the CDK app and its stacks (imports aws_cdk lazily)."""
+    import aws_cdk as cdk
+    from transcribe_stack import TranscribeStack
+
+    app = cdk.App()
+    selected = _selected_stacks()
+    if selected is None or STACK_ID in selected:
+        TranscribeStack(
+            app,
+            STACK_ID,
+            env=cdk.Environment(
+                account=os.getenv("CDK_DEFAULT_ACCOUNT"),
+                # Default region set to eu-west-1 to match ffmpeg layer ARN region; override via CDK_DEFAULT_REGION env var if desired.
+                region=os.getenv("CDK_DEFAULT_REGION", "eu-west-1"),
+            ),
+        )
+    return app
+
+
+if __name__ == "__main__":
+    build().synth()
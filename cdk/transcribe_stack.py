@@ -9,6 +9,51 @@ from aws_cdk import (
 )
 
 DEFAULT_FFMPEG_LAYER_ARN = ""  # "arn:aws:lambda:eu-west-1:182544233882:layer:ffmpeg:1"  <- Created manually
+FFMPEG_STATIC_URL = "https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz"
+# Host-side cache for the ffmpeg tarball (override via FFMPEG_CACHE_DIR) and its mount point in the bundling container
+DEFAULT_FFMPEG_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "motek-transcribe")
+FFMPEG_CACHE_MOUNT = "/cache"
+
+# Numeric Lambda defaults, pre-rendered as the strings Lambda env vars require
+_DEFAULT_SEG_SECONDS = "420"  # 7 minutes
+_DEFAULT_MAX_SEGMENT_SIZE = "8388608"  # 8MB
+_DEFAULT_MAX_PAYLOAD_SIZE = "9437184"  # 9MB
+
+# Lambda environment variables and their defaults, read from the synth-time environment.
+_ENV_DEFAULTS = (
+    ("SERVICE_ACCOUNT_FILE", "sa.json"),
+    ("DRIVE_FOLDER_ID", "CHANGE_ME"),
+    ("EMAIL_TO", "CHANGE_ME"),
+    ("GMAIL_SENDER_EMAIL", "CHANGE_ME"),
+    ("GMAIL_APP_PASSWORD", "CHANGE_ME"),
+    # New SMTP configuration (Gmail defaults, overridable for other providers)
+    ("SMTP_SERVER", "smtp.gmail.com"),
+    ("SMTP_PORT", "465"),
+    ("SMTP_USE_SSL", "1"),
+    ("RUNPOD_API_KEY", "CHANGE_ME"),
+    ("RUNPOD_ENDPOINT_ID", "CHANGE_ME"),
+    ("CONFIG_PATH", "config.json"),
+    ("MAX_SEGMENT_CONCURRENCY", "4"),
+    ("MAX_FILE_CONCURRENCY", "1"),
+    ("SEG_SECONDS", _DEFAULT_SEG_SECONDS),
+    ("MAX_SEGMENT_SIZE", _DEFAULT_MAX_SEGMENT_SIZE),
+    ("TIME_WINDOW_ENABLED", "1"),
+    ("SCHEDULE_START_HOUR", "8"),
+    ("SCHEDULE_END_HOUR", "22"),
+    ("SCHEDULE_DAYS", "SUN-SAT"),  # full week
+    ("SCHEDULE_TIMEZONE", "UTC"),
+    ("SKIP_DRIVE", "0"),
+    ("BYPASS_SPLIT", "0"),
+    ("FUSED_CONVERT_SPLIT", "0"),
+    ("FFMPEG_PATH", "/opt/bin/ffmpeg"),
+    ("MAX_SEGMENT_RETRIES", "2"),
+    ("BALANCE_ALERT_VALUE", "2"),
+    ("ADD_RANDOM_PERSONAL_MESSAGE", "1"),
+    # New recursive payload splitting controls
+    ("MAX_PAYLOAD_SIZE", _DEFAULT_MAX_PAYLOAD_SIZE),
+    ("MAX_SPLIT_DEPTH", "3"),
+    ("TRANSCRIPTION_LANGUAGE", "en"),
+)
 
 # The stack can either (1) attach an existing ffmpeg layer via FFMPEG_LAYER_ARN env var or default ARN
 # or (2) build a new layer with a static ffmpeg binary during bundling.
@@ -20,7 +65,8 @@ class TranscribeStack(cdk.Stack):
         project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         python_runtime = _lambda.Runtime.PYTHON_3_11
 
-        external_ffmpeg_layer_arn = os.getenv("FFMPEG_LAYER_ARN") or DEFAULT_FFMPEG_LAYER_ARN
+        env = os.environ
+        external_ffmpeg_layer_arn = env.get("FFMPEG_LAYER_ARN") or DEFAULT_FFMPEG_LAYER_ARN
         ffmpeg_layer: _lambda.ILayerVersion
         if external_ffmpeg_layer_arn:
             ffmpeg_layer = _lambda.LayerVersion.from_layer_version_arn(
@@ -29,11 +75,18 @@ class TranscribeStack(cdk.Stack):
                 layer_version_arn=external_ffmpeg_layer_arn,
             )
         else:
+            # Keep the downloaded tarball in a host cache dir mounted into the bundling
+            # container so repeated synths only download on a cache miss.
+            ffmpeg_cache_dir = env.get("FFMPEG_CACHE_DIR") or DEFAULT_FFMPEG_CACHE_DIR
+            os.makedirs(ffmpeg_cache_dir, exist_ok=True)
             ffmpeg_download_cmd = (
                 "mkdir -p /asset-output/bin "
-                "&& curl -L https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz "
-                "-o /tmp/ffmpeg.tar.xz "
-                "&& tar -xJf /tmp/ffmpeg.tar.xz -C /tmp "
+                f"&& (test -s {FFMPEG_CACHE_MOUNT}/ffmpeg.tar.xz "
+                f"|| (curl -fL {FFMPEG_STATIC_URL} -o {FFMPEG_CACHE_MOUNT}/ffmpeg.tar.xz.part "
+                f"&& mv {FFMPEG_CACHE_MOUNT}/ffmpeg.tar.xz.part {FFMPEG_CACHE_MOUNT}/ffmpeg.tar.xz)) "
+                # Decompress with all cores: pixz if present, else multi-threaded xz
+                f"&& if command -v pixz >/dev/null 2>&1; then pixz -d < {FFMPEG_CACHE_MOUNT}/ffmpeg.tar.xz | tar -xf - -C /tmp; "
+                f"else xz -T0 -dc {FFMPEG_CACHE_MOUNT}/ffmpeg.tar.xz | tar -xf - -C /tmp; fi "
                 "&& cp /tmp/ffmpeg-*-amd64-static/ffmpeg /asset-output/bin/ffmpeg "
                 "&& chmod +x /asset-output/bin/ffmpeg"
             )
@@ -41,6 +94,7 @@ class TranscribeStack(cdk.Stack):
                 "image": python_runtime.bundling_image,
                 "user": "root",
                 "command": ["bash", "-c", ffmpeg_download_cmd],
+                "volumes": [cdk.DockerVolume(host_path=ffmpeg_cache_dir, container_path=FFMPEG_CACHE_MOUNT)],
             }
             ffmpeg_layer = _lambda.LayerVersion(
                 self,
@@ -63,38 +117,7 @@ class TranscribeStack(cdk.Stack):
             "command": ["bash", "-c", app_bundling_cmd],
         }
 
-        env_vars = {
-            "SERVICE_ACCOUNT_FILE": os.getenv("SERVICE_ACCOUNT_FILE", "sa.json"),
-            "DRIVE_FOLDER_ID": os.getenv("DRIVE_FOLDER_ID", "CHANGE_ME"),
-            "EMAIL_TO": os.getenv("EMAIL_TO", "CHANGE_ME"),
-            "GMAIL_SENDER_EMAIL": os.getenv("GMAIL_SENDER_EMAIL", "CHANGE_ME"),
-            "GMAIL_APP_PASSWORD": os.getenv("GMAIL_APP_PASSWORD", "CHANGE_ME"),
-            # New SMTP configuration (Gmail defaults, overridable for other providers)
-            "SMTP_SERVER": os.getenv("SMTP_SERVER", "smtp.gmail.com"),
-            "SMTP_PORT": os.getenv("SMTP_PORT", "465"),
-            "SMTP_USE_SSL": os.getenv("SMTP_USE_SSL", "1"),
-            "RUNPOD_API_KEY": os.getenv("RUNPOD_API_KEY", "CHANGE_ME"),
-            "RUNPOD_ENDPOINT_ID": os.getenv("RUNPOD_ENDPOINT_ID", "CHANGE_ME"),
-            "CONFIG_PATH": os.getenv("CONFIG_PATH", "config.json"),
-            "MAX_SEGMENT_CONCURRENCY": os.getenv("MAX_SEGMENT_CONCURRENCY", "4"),
-            "SEG_SECONDS": os.getenv("SEG_SECONDS", str(7 * 60)),
-            "MAX_SEGMENT_SIZE": os.getenv("MAX_SEGMENT_SIZE", str(8 * 1024 * 1024)),
-            "TIME_WINDOW_ENABLED": os.getenv("TIME_WINDOW_ENABLED", "1"),
-            "SCHEDULE_START_HOUR": os.getenv("SCHEDULE_START_HOUR", "8"),
-            "SCHEDULE_END_HOUR": os.getenv("SCHEDULE_END_HOUR", "22"),
-            "SCHEDULE_DAYS": os.getenv("SCHEDULE_DAYS", "SUN-SAT"),  # full week
-            "SCHEDULE_TIMEZONE": os.getenv("SCHEDULE_TIMEZONE", "UTC"),
-            "SKIP_DRIVE": os.getenv("SKIP_DRIVE", "0"),
-            "BYPASS_SPLIT": os.getenv("BYPASS_SPLIT", "0"),
-            "FFMPEG_PATH": os.getenv("FFMPEG_PATH", "/opt/bin/ffmpeg"),
-            "MAX_SEGMENT_RETRIES": os.getenv("MAX_SEGMENT_RETRIES", "2"),
-            "BALANCE_ALERT_VALUE": os.getenv("BALANCE_ALERT_VALUE", "2"),
-            "ADD_RANDOM_PERSONAL_MESSAGE": os.getenv("ADD_RANDOM_PERSONAL_MESSAGE", "1"),
-            # New recursive payload splitting controls
-            "MAX_PAYLOAD_SIZE": os.getenv("MAX_PAYLOAD_SIZE", str(9 * 1024 * 1024)),  # 9MB default
-            "MAX_SPLIT_DEPTH": os.getenv("MAX_SPLIT_DEPTH", "3"),
-            "TRANSCRIPTION_LANGUAGE": os.getenv("TRANSCRIPTION_LANGUAGE", "en"),
-        }
+        env_vars = {k: env.get(k, d) for k, d in _ENV_DEFAULTS}
 
         lambda_fn = _lambda.Function(
             self,
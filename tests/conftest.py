@@ -1,5 +1,18 @@
 import os, sys
+import pytest
+
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
+# Tests control env explicitly via monkeypatch; don't parse a developer's .env on import.
+os.environ.setdefault("_DOTENV_LOADED", "1")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _config_cache_session():
+    """Start and finish the session with an empty load_config cache."""
+    from transcriber.config import load_config
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
@@ -8,7 +8,7 @@ from transcriber.audio import convert_to_mp3
 
 def _fake_service(file_entries):
     class _Files:
-        def list(self, q=None, fields=None):
+        def list(self, q=None, fields=None, **kwargs):
             class _Exec:
                 def execute(self_non):
                     return {"files": file_entries}
@@ -38,6 +38,33 @@ def test_list_audio_files_multi_extension(monkeypatch):
     assert "doc.txt" not in names
 
 
+def test_list_audio_files_follows_pagination(monkeypatch):
+    monkeypatch.setenv("AUDIO_EXTENSIONS", ".m4a,.wav,.mp3")
+    import transcriber.drive as d1
+    importlib.reload(d1)
+    pages = {
+        None: {"files": [{"id": "1", "name": "a.m4a"}, {"id": "2", "name": "notes.txt"}], "nextPageToken": "p2"},
+        "p2": {"files": [{"id": "3", "name": "b.wav"}]},
+    }
+    seen = []
+
+    class _Files:
+        def list(self, q=None, fields=None, pageSize=None, orderBy=None, pageToken=None):
+            seen.append((pageSize, orderBy, pageToken))
+            class _Exec:
+                def execute(self_non):
+                    return pages[pageToken]
+            return _Exec()
+
+    class _Svc:
+        def files(self):
+            return _Files()
+
+    listed = d1.list_audio_files(_Svc(), "folder", False)
+    assert [f["id"] for f in listed] == ["1", "3"]
+    assert seen == [(1000, "createdTime", None), (1000, "createdTime", "p2")]
+
+
 def test_convert_to_mp3_skips_for_mp3(tmp_path):
     # create a dummy mp3 file (content irrelevant)
     src = tmp_path / "input.mp3"
@@ -46,3 +73,25 @@ def test_convert_to_mp3_skips_for_mp3(tmp_path):
     convert_to_mp3(str(src), str(dst))
     assert dst.read_bytes() == b"dummy data"
 
+
+
+def test_convert_and_split_single_ffmpeg_pass(tmp_path, monkeypatch):
+    import transcriber.audio as audio_mod
+    src = tmp_path / "input.wav"
+    src.write_bytes(b"dummy data")
+    calls = []
+    monkeypatch.setattr(audio_mod.subprocess, "check_call", lambda args, **kw: calls.append(args) or 0)
+    audio_mod.convert_and_split(str(src), str(tmp_path / "seg%03d.mp3"), 120)
+    assert len(calls) == 1
+    args = calls[0]
+    assert "libmp3lame" in args
+    assert args[args.index("-f") + 1] == "segment"
+    assert args[args.index("-segment_time") + 1] == "120"
+
+
+def test_fused_segment_seconds_uses_typical_bitrate():
+    from transcriber.audio import fused_segment_seconds
+    # 8 MiB at 190 kbps with 10% safety -> 317s, below the 420s default
+    assert fused_segment_seconds(8 * 1024 * 1024, 420) == 317
+    assert fused_segment_seconds(8 * 1024 * 1024, 120) == 120
+    assert fused_segment_seconds(1000, 420) == 30
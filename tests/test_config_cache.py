@@ -0,0 +1,46 @@
+import os
+from transcriber.config import load_config
+
+
+def test_load_config_cached_for_unchanged_env(monkeypatch):
+    monkeypatch.setenv("MAX_SEGMENT_RETRIES", "4")
+    first = load_config()
+    second = load_config()
+    assert first is second
+
+
+def test_load_config_cache_invalidated_by_env_change(monkeypatch):
+    monkeypatch.setenv("MAX_SEGMENT_RETRIES", "4")
+    assert load_config().max_segment_retries == 4
+    monkeypatch.setenv("MAX_SEGMENT_RETRIES", "6")
+    assert load_config().max_segment_retries == 6
+
+
+def test_load_config_cache_invalidated_by_file_change(tmp_path):
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text('{"languages": {"he": {"model": "a"}}}', encoding="utf-8")
+    assert load_config(str(cfg_file)).languages["he"]["model"] == "a"
+    cfg_file.write_text('{"languages": {"he": {"model": "b"}}}', encoding="utf-8")
+    st = os.stat(cfg_file)
+    os.utime(cfg_file, (st.st_atime, st.st_mtime + 10))
+    assert load_config(str(cfg_file)).languages["he"]["model"] == "b"
+    load_config.cache_clear()
+    assert load_config(str(cfg_file)).languages["he"]["model"] == "b"
+
+
+def test_load_config_reloads_when_size_changes_with_same_mtime(tmp_path):
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text('{"languages": {"he": {"model": "a"}}}', encoding="utf-8")
+    st = os.stat(cfg_file)
+    assert load_config(str(cfg_file)).languages["he"]["model"] == "a"
+    cfg_file.write_text('{"languages": {"he": {"model": "bigger"}}}', encoding="utf-8")
+    os.utime(cfg_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert load_config(str(cfg_file)).languages["he"]["model"] == "bigger"
+
+
+def test_cached_config_is_immutable():
+    import dataclasses
+    import pytest
+    cfg = load_config()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.seg_seconds = 1
@@ -0,0 +1,44 @@
+from transcriber import drive as drive_mod
+
+
+def _fake_service(existing):
+    """Drive stub: `existing` maps parent id -> processed folder id (or None)."""
+    calls = {"list": 0, "create": 0}
+
+    class _Exec:
+        def __init__(self, result):
+            self._result = result
+
+        def execute(self):
+            return self._result
+
+    class _Files:
+        def list(self, q=None, fields=None, pageSize=None):
+            calls["list"] += 1
+            parent = q.split("'")[1]
+            fid = existing.get(parent)
+            return _Exec({"files": [{"id": fid}] if fid else []})
+
+        def create(self, body=None, fields=None):
+            calls["create"] += 1
+            return _Exec({"id": f"new-{body['parents'][0]}"})
+
+    class _Svc:
+        def files(self):
+            return _Files()
+
+    return _Svc(), calls
+
+
+def test_processed_folder_cached_per_parent():
+    drive_mod.clear_processed_folder_cache()
+    svc, calls = _fake_service({"parentA": "procA"})
+    assert drive_mod.get_or_create_processed_folder(svc, "parentA", False) == "procA"
+    assert drive_mod.get_or_create_processed_folder(svc, "parentA", False) == "procA"
+    assert calls["list"] == 1
+    # A different parent must not reuse parentA's folder
+    assert drive_mod.get_or_create_processed_folder(svc, "parentB", False) == "new-parentB"
+    assert calls == {"list": 2, "create": 1}
+    assert drive_mod.get_or_create_processed_folder(svc, "parentB", False) == "new-parentB"
+    assert calls == {"list": 2, "create": 1}
+    drive_mod.clear_processed_folder_cache()
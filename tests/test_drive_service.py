@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+from transcriber import drive as drive_mod
+
+
+def test_drive_service_cached_per_service_account(tmp_path, monkeypatch):
+    sa = tmp_path / "sa.json"
+    sa.write_text("{}", encoding="utf-8")
+    loads = []
+    builds = []
+
+    def fake_from_file(path, scopes=None):
+        loads.append(path)
+        return SimpleNamespace(expired=False, valid=True)
+
+    def fake_build(name, version, credentials=None, cache_discovery=False):
+        builds.append(credentials)
+        return object()
+
+    monkeypatch.setattr(drive_mod.service_account.Credentials, "from_service_account_file", fake_from_file)
+    monkeypatch.setattr(drive_mod, "build", fake_build)
+    monkeypatch.setattr(drive_mod, "_DRIVE_SERVICE_CACHE", {})
+
+    first = drive_mod.drive_service(False, str(sa))
+    second = drive_mod.drive_service(False, str(sa))
+    assert first is second
+    assert loads == [str(sa)]
+    assert len(builds) == 1
+    assert drive_mod.drive_service(True, str(sa)) is None
@@ -0,0 +1,62 @@
+import transcriber.emailer as emailer_mod
+
+
+class _FakeSMTP:
+    sent = []
+    connections = 0
+
+    def __init__(self, host, port, context=None):
+        self.host, self.port = host, port
+        _FakeSMTP.connections += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg, from_addr=None, to_addrs=None):
+        _FakeSMTP.sent.append((msg, from_addr, to_addrs))
+
+    def quit(self):
+        pass
+
+
+def test_send_email_attaches_transcript_as_text(tmp_path, monkeypatch):
+    _FakeSMTP.sent = []
+    monkeypatch.setattr(emailer_mod.smtplib, "SMTP_SSL", _FakeSMTP)
+    transcript = tmp_path / "talk_transcription.txt"
+    transcript.write_text("שלום עולם\nhello", encoding="utf-8")
+
+    ok = emailer_mod.send_transcription_email(
+        "pw", "me@example.com", "you@example.com", "Subject", "Body text", str(transcript)
+    )
+    assert ok is True
+    msg, from_addr, to_addrs = _FakeSMTP.sent[0]
+    assert (from_addr, to_addrs) == ("me@example.com", "you@example.com")
+    attachments = list(msg.iter_attachments())
+    assert len(attachments) == 1
+    att = attachments[0]
+    assert att.get_content_type() == "text/plain"
+    assert att.get_filename() == "talk_transcription.txt"
+    assert att.get_content().rstrip("\n") == "שלום עולם\nhello"
+    assert msg.get_body(preferencelist=("plain",)).get_content().strip() == "Body text"
+
+
+def test_send_email_skipped_without_credentials():
+    assert emailer_mod.send_transcription_email(None, None, None, "s", "b", None) is False
+
+
+def test_sender_reuses_connection_until_limit(monkeypatch):
+    _FakeSMTP.sent = []
+    _FakeSMTP.connections = 0
+    monkeypatch.setattr(emailer_mod.smtplib, "SMTP_SSL", _FakeSMTP)
+
+    with emailer_mod.GmailSender("me@example.com", "pw", max_messages_per_connection=2) as sender:
+        results = [sender.send("you@example.com", f"s{i}", "b", None) for i in range(5)]
+    assert results == [True] * 5
+    assert len(_FakeSMTP.sent) == 5
+    assert _FakeSMTP.connections == 3
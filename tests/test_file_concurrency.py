@@ -0,0 +1,46 @@
+import asyncio
+import types
+
+from transcriber import runner
+
+
+def test_files_processed_concurrently_in_order(monkeypatch):
+    cfg = types.SimpleNamespace(
+        within_schedule_window=True,
+        skip_drive=False,
+        drive_folder_id="folder",
+        service_account_file=None,
+        runpod_api_key="k",
+        runpod_endpoint_id="e",
+        languages={},
+        transcription_language="he",
+        max_file_concurrency=2,
+        gmail_sender_email=None,
+        gmail_app_password=None,
+    )
+    files = [{"id": f"f{i}", "name": f"a{i}.mp3"} for i in range(5)]
+    monkeypatch.setattr(runner, "drive_service", lambda *a: object())
+    monkeypatch.setattr(runner, "list_audio_files", lambda *a: files)
+    monkeypatch.setattr(runner, "get_or_create_processed_folder", lambda *a: "processed")
+    monkeypatch.setattr(runner, "load_model", lambda *a, **k: object())
+
+    async def fake_balance(api_key, session=None):
+        return None
+    monkeypatch.setattr(runner, "fetch_runpod_balance", fake_balance)
+
+    state = {"active": 0, "peak": 0}
+
+    async def fake_process(cfg, f, *args):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        # Later files finish first to check ordering is preserved
+        await asyncio.sleep(0.01 * (5 - int(f["id"][1:])))
+        state["active"] -= 1
+        return {"id": f["id"]}
+    monkeypatch.setattr(runner, "_process_drive_file", fake_process)
+
+    result = asyncio.run(runner.process_drive_files(cfg))
+    assert [s["id"] for s in result["processed"]] == [f["id"] for f in files]
+    assert result["total_files"] == 5
+    assert state["peak"] == 2
+
@@ -1,6 +1,7 @@
 import os
 import shutil
 import asyncio
+import pytest
 from types import SimpleNamespace
 from datetime import datetime, timezone
 
@@ -10,7 +11,8 @@ import transcriber.audio as audio_mod
 import transcriber.model as model_mod
 
 
-def test_integration_hebrew_sample(tmp_path, monkeypatch):
+@pytest.mark.parametrize("fused", [False, True])
+def test_integration_hebrew_sample(tmp_path, monkeypatch, fused):
     """Integration-style test: simulate a single Drive file (tests/test_assets/hebrew_sample.m4a)
 
     This test exercises the runner pipeline end-to-end while mocking external
@@ -47,10 +49,18 @@ def test_integration_hebrew_sample(tmp_path, monkeypatch):
     def fake_convert(inp, outp):
         shutil.copyfile(inp, outp)
 
-    # Avoid calling ffprobe by making _probe_duration return a small value
+    # Single-pass convert+split (FUSED_CONVERT_SPLIT=1): emit one copied segment
+    def fake_convert_and_split(inp, out_pattern, seg_seconds):
+        shutil.copyfile(inp, out_pattern.replace("%03d", "000"))
+        return [1.0]
+
+    # Avoid calling ffprobe by making the duration probes return a small value
     def fake_probe(path):
         return 1.0
 
+    async def fake_probe_async(path):
+        return 1.0
+
     # Dummy model that yields a single text segment containing the filename
     class DummyModel:
         def transcribe_async(self, path, diarize=True):
@@ -69,9 +79,12 @@ def test_integration_hebrew_sample(tmp_path, monkeypatch):
     monkeypatch.setattr(runner_mod, 'get_or_create_processed_folder', fake_get_or_create)
     monkeypatch.setattr(runner_mod, 'move_file_to_folder', fake_move)
     monkeypatch.setattr(runner_mod, 'convert_to_mp3', fake_convert)
+    monkeypatch.setattr(runner_mod, 'convert_and_split', fake_convert_and_split)
     monkeypatch.setattr(runner_mod, 'drive_service', lambda skip_drive, sa: None)
-    # transcribe_file calls model._probe_duration internally; patch on model_mod
+    # transcribe_file probes segment durations via _probe_duration_async (and the
+    # recursive split via _probe_duration); patch both on model_mod
     monkeypatch.setattr(model_mod, '_probe_duration', fake_probe)
+    monkeypatch.setattr(model_mod, '_probe_duration_async', fake_probe_async)
     # runner calls load_model (imported into runner); patch runner_mod.load_model
     monkeypatch.setattr(runner_mod, 'load_model', fake_load_model)
 
@@ -82,11 +95,14 @@ def test_integration_hebrew_sample(tmp_path, monkeypatch):
     cfg.drive_folder_id = 'dummy'
     cfg.service_account_file = None
     cfg.languages = {'he': {'model': 'dummy'}}
+    cfg.transcription_language = 'he'
     cfg.runpod_api_key = 'dummy'
     cfg.runpod_endpoint_id = 'dummy'
     cfg.seg_seconds = 30
     cfg.max_segment_concurrency = 1
     cfg.bypass_split = False
+    cfg.fused_convert_split = fused
+    cfg.max_file_concurrency = 1
     cfg.max_segment_retries = 0
     cfg.max_payload_size = 9 * 1024 * 1024
     cfg.max_split_depth = 3
@@ -0,0 +1,24 @@
+import types
+
+import transcriber.model as model_mod
+
+
+def test_load_model_reuses_client(monkeypatch):
+    calls = []
+
+    def fake_load_model(**kwargs):
+        calls.append(kwargs)
+        return object()
+    monkeypatch.setattr(model_mod, "ivrit", types.SimpleNamespace(load_model=fake_load_model))
+    monkeypatch.setattr(model_mod, "_MODEL_CACHE", {})
+    langs = {"he": {"model": "m-he"}, "en": {"model": "m-en"}}
+
+    first = model_mod.load_model("key", "ep", langs, language="he")
+    second = model_mod.load_model("key", "ep", langs, language="he")
+    other = model_mod.load_model("key", "ep", langs, language="en")
+    other_key = model_mod.load_model("key2", "ep", langs, language="he")
+
+    assert first is second
+    assert other is not first
+    assert other_key is not first
+    assert [(c["model"], c["api_key"]) for c in calls] == [("m-he", "key"), ("m-en", "key"), ("m-he", "key2")]
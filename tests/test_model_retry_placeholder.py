@@ -33,3 +33,27 @@ def test_failed_segments_placeholder(tmp_path):
     assert any("[Transcription failed - 00:00:00 - 00:00:10" in l for l in lines)
     assert any("[Transcription failed - 00:00:10 - 00:00:20" in l for l in lines)
     assert "Reason: boom" in full_text
+
+
+def test_backoff_delay_exponential_capped():
+    from transcriber.model import _backoff_delay, BACKOFF_CAP_S
+    for attempt, base in ((1, 1), (2, 2), (3, 4), (4, 8), (10, BACKOFF_CAP_S)):
+        d = _backoff_delay(attempt)
+        assert 0.75 * base <= d <= 1.25 * base
+
+
+def test_retry_sleep_releases_semaphore(monkeypatch):
+    import transcriber.model as model_mod
+    monkeypatch.setattr(model_mod, "_backoff_delay", lambda attempt: 0.05)
+    sem = asyncio.Semaphore(1)
+    held_during_sleep = []
+    real_sleep = asyncio.sleep
+
+    async def spy_sleep(delay):
+        held_during_sleep.append(sem.locked())
+        await real_sleep(0)
+    monkeypatch.setattr(model_mod.asyncio, "sleep", spy_sleep)
+
+    res = asyncio.run(model_mod.transcribe_segment(DummyModel(), "x.mp3", 0, 0.0, 5.0, max_retries=2, payload_size_cap=1, sem=sem))
+    assert "Reason: boom" in res["text"]
+    assert held_during_sleep == [False, False]
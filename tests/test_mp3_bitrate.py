@@ -0,0 +1,59 @@
+import transcriber.audio as audio_mod
+from transcriber.audio import _get_bitrate_bits
+
+# MPEG-1 Layer III, no CRC, 128 kbps, 44.1 kHz, stereo
+CBR_HEADER = b"\xff\xfb\x90\x00"
+CBR_FRAME = CBR_HEADER + b"\x00" * 413  # 144 * 128000 / 44100 = 417 bytes
+# Same stream parameters at 160 kbps: 522 bytes
+FRAME_160 = b"\xff\xfb\xa0\x00" + b"\x00" * 518
+
+
+def _id3_tag(payload_size: int) -> bytes:
+    size = bytes([(payload_size >> s) & 0x7F for s in (21, 14, 7, 0)])
+    return b"ID3\x04\x00\x00" + size + b"\x00" * payload_size
+
+
+def test_bitrate_from_cbr_frame_header(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_mod, "_probe_bitrate_bits", lambda p: None)
+    mp3 = tmp_path / "cbr.mp3"
+    mp3.write_bytes(_id3_tag(300) + CBR_FRAME * 3)
+    assert _get_bitrate_bits(str(mp3)) == 128000
+
+
+def test_bitrate_from_xing_vbr_header(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_mod, "_probe_bitrate_bits", lambda p: None)
+    frames, total_bytes = 1000, 3_000_000
+    xing = b"Xing" + (3).to_bytes(4, "big") + frames.to_bytes(4, "big") + total_bytes.to_bytes(4, "big")
+    mp3 = tmp_path / "vbr.mp3"
+    xing_frame = CBR_HEADER + b"\x00" * 32 + xing
+    mp3.write_bytes(xing_frame + b"\x00" * (417 - len(xing_frame)) + FRAME_160 + CBR_FRAME)
+    expected = int(total_bytes * 8 * 44100 / (frames * 1152))
+    assert _get_bitrate_bits(str(mp3)) == expected
+
+
+def test_bitrate_falls_back_to_ffprobe(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_mod, "_probe_bitrate_bits", lambda p: 64000)
+    mp3 = tmp_path / "garbage.mp3"
+    mp3.write_bytes(b"0" * 1000)
+    assert _get_bitrate_bits(str(mp3)) == 64000
+
+
+def test_false_sync_without_following_frame_uses_ffprobe(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_mod, "_probe_bitrate_bits", lambda p: 64000)
+    mp3 = tmp_path / "junk.mp3"
+    mp3.write_bytes(b"0" * 100 + CBR_HEADER + b"0" * 1000)
+    assert _get_bitrate_bits(str(mp3)) == 64000
+
+
+def test_false_sync_skipped_before_real_frames(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_mod, "_probe_bitrate_bits", lambda p: None)
+    mp3 = tmp_path / "lead.mp3"
+    mp3.write_bytes(b"\xff\xfb\xa0\x00" + b"0" * 50 + CBR_FRAME * 2)
+    assert _get_bitrate_bits(str(mp3)) == 128000
+
+
+def test_vbr_without_xing_header_uses_ffprobe(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_mod, "_probe_bitrate_bits", lambda p: 190000)
+    mp3 = tmp_path / "vbr_noxing.mp3"
+    mp3.write_bytes(CBR_FRAME + FRAME_160 + CBR_FRAME)
+    assert _get_bitrate_bits(str(mp3)) == 190000
@@ -18,3 +18,12 @@ def test_generate_positive_personal_message_variation_and_personalization():
     assert any(m.splitlines()[0].lower().count("alice") for m in msgs)
 
 
+
+
+def test_time_of_day_phrase_follows_utc_hour(monkeypatch):
+    import transcriber.utils as utils_mod
+    monkeypatch.setattr(utils_mod, "_TOD_CACHE", [-1, ""])
+    monkeypatch.setattr(utils_mod.time, "time", lambda: 9 * 3600 + 30)
+    assert utils_mod._tod() == "morning"
+    monkeypatch.setattr(utils_mod.time, "time", lambda: 20 * 3600 + 30)
+    assert utils_mod._tod() == "evening"
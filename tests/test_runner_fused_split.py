@@ -0,0 +1,79 @@
+import asyncio
+import types
+
+from transcriber import runner
+
+
+def _cfg(**overrides):
+    cfg = types.SimpleNamespace(
+        skip_drive=False,
+        bypass_split=False,
+        fused_convert_split=False,
+        seg_seconds=420,
+        max_segment_size=8 * 1024 * 1024,
+        max_segment_concurrency=1,
+        max_segment_retries=0,
+        max_payload_size=9 * 1024 * 1024,
+        max_split_depth=1,
+        runpod_api_key="k",
+        add_random_personal_message=False,
+        balance_alert_value=2.0,
+        email_to=None,
+        drive_folder_id="folder",
+    )
+    for k, v in overrides.items():
+        setattr(cfg, k, v)
+    return cfg
+
+
+def _patch_pipeline(tmp_path, monkeypatch):
+    calls = {"convert": 0, "fused": [], "transcribe": {}}
+    monkeypatch.setattr(runner, "TEMP_DIR", str(tmp_path))
+    monkeypatch.setattr(runner, "download_file", lambda *a: None)
+    monkeypatch.setattr(runner, "move_file_to_folder", lambda *a: None)
+
+    def fake_convert(*a):
+        calls["convert"] += 1
+    monkeypatch.setattr(runner, "convert_to_mp3", fake_convert)
+
+    def fake_convert_and_split(src, pattern, seg_secs):
+        calls["fused"].append(seg_secs)
+        return [12.0]
+    monkeypatch.setattr(runner, "convert_and_split", fake_convert_and_split)
+
+    async def fake_transcribe(model, **kwargs):
+        calls["transcribe"].update(kwargs)
+        return "text", ["seg000.mp3"]
+    monkeypatch.setattr(runner, "transcribe_file", fake_transcribe)
+
+    async def fake_balance(api_key, session=None):
+        return None
+    monkeypatch.setattr(runner, "fetch_runpod_balance", fake_balance)
+    return calls
+
+
+def _process(cfg, name):
+    mailer = types.SimpleNamespace(send=lambda *a: False)
+    return asyncio.run(runner._process_drive_file(
+        cfg, {"id": "f1", "name": name}, None, asyncio.Lock(), mailer, object(), "processed", None
+    ))
+
+
+def test_non_mp3_converted_and_split_in_one_pass_when_enabled(tmp_path, monkeypatch):
+    calls = _patch_pipeline(tmp_path, monkeypatch)
+    res = _process(_cfg(fused_convert_split=True), "talk.m4a")
+    assert res["segments"] == 1
+    assert calls["convert"] == 0
+    assert calls["fused"] == [317]
+    assert calls["transcribe"]["bypass_split"] is True
+    assert calls["transcribe"]["durations"] == [12.0]
+
+
+def test_default_converts_then_size_splits(tmp_path, monkeypatch):
+    calls = _patch_pipeline(tmp_path, monkeypatch)
+    res = _process(_cfg(), "talk.m4a")
+    assert res["segments"] == 1
+    assert calls["convert"] == 1
+    assert calls["fused"] == []
+    assert calls["transcribe"]["bypass_split"] is False
+    assert calls["transcribe"]["durations"] is None
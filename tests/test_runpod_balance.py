@@ -0,0 +1,63 @@
+import asyncio
+
+import transcriber.runner as runner_mod
+
+
+class _FakeResp:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return {"data": {"myself": {"clientBalance": 12.5, "currentSpendPerHr": 0.1, "spendLimit": 50}}}
+
+
+class _FakeSession:
+    def __init__(self):
+        self.posts = 0
+
+    def post(self, url, headers=None, json=None):
+        self.posts += 1
+        return _FakeResp()
+
+
+def test_balance_snapshot_reused_within_ttl(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(runner_mod, "_BALANCE_CACHE", {})
+
+    async def _twice():
+        return await runner_mod.fetch_runpod_balance("key", session), await runner_mod.fetch_runpod_balance("key", session)
+
+    first, second = asyncio.run(_twice())
+    assert first == second
+    assert first["clientBalance"] == 12.5
+    assert session.posts == 1
+
+    monkeypatch.setattr(runner_mod, "BALANCE_CACHE_TTL_S", 0.0)
+    asyncio.run(runner_mod.fetch_runpod_balance("key", session))
+    assert session.posts == 2
+
+
+def test_balance_without_session_opens_and_closes_its_own(monkeypatch):
+    session = _FakeSession()
+    state = {"closed": False}
+
+    class _OwnedSession:
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *exc):
+            state["closed"] = True
+            return False
+    monkeypatch.setattr(runner_mod, "_new_http_session", _OwnedSession)
+    monkeypatch.setattr(runner_mod, "_BALANCE_CACHE", {})
+
+    result = asyncio.run(runner_mod.fetch_runpod_balance("key"))
+    assert result["clientBalance"] == 12.5
+    assert session.posts == 1
+    assert state["closed"] is True
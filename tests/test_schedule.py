@@ -1,3 +1,4 @@
+import datetime
 import os
 
 from transcriber.config import load_config
@@ -19,3 +20,20 @@ def test_within_window_disabled():
     os.environ['TIME_WINDOW_ENABLED'] = '0'
     cfg = load_config()
     assert cfg.within_schedule_window is True  # disabled should allow
+
+
+def test_within_window_unknown_timezone_falls_back_to_utc(monkeypatch):
+    monkeypatch.setenv('TIME_WINDOW_ENABLED', '1')
+    monkeypatch.setenv('SCHEDULE_DAYS', 'SUN-SAT')
+    monkeypatch.setenv('SCHEDULE_START_HOUR', '0')
+    monkeypatch.setenv('SCHEDULE_END_HOUR', '23')
+    monkeypatch.setenv('SCHEDULE_TIMEZONE', 'Not/AZone')
+    cfg = load_config()
+    assert cfg._tz is datetime.timezone.utc
+    assert cfg.within_schedule_window is True
+
+
+def test_schedule_days_wraparound_range_parsed_once(monkeypatch):
+    monkeypatch.setenv('SCHEDULE_DAYS', 'FRI-MON')
+    cfg = load_config()
+    assert cfg._allowed_days == frozenset({4, 5, 6, 0})
@@ -0,0 +1,72 @@
+import asyncio
+
+import transcriber.model as model_mod
+from transcriber.model import transcribe_file
+
+
+class FailingModel:
+    def transcribe_async(self, path, diarize=True):
+        async def gen():
+            raise Exception("boom")
+            yield  # unreachable, ensures async generator type
+        return gen()
+
+
+def test_probed_durations_drive_segment_timestamps(tmp_path, monkeypatch):
+    for i in range(3):
+        (tmp_path / f"seg00{i}.mp3").write_bytes(b"")
+    fake = {"seg000.mp3": 5.0, "seg001.mp3": 7.0, "seg002.mp3": 0.0}
+
+    async def fake_probe(path):
+        return fake[path.rsplit("/", 1)[-1]]
+    monkeypatch.setattr(model_mod, "_probe_duration_async", fake_probe)
+
+    full_text, segments = asyncio.run(transcribe_file(
+        FailingModel(),
+        mp3_full_path=str(tmp_path / "seg000.mp3"),
+        work_dir=str(tmp_path),
+        seg_seconds=10,
+        max_concurrency=3,
+        bypass_split=True,
+        splitter_fn=lambda *a, **k: None,
+        max_segment_retries=0,
+        max_payload_size=10_000_000,
+        max_split_depth=3,
+    ))
+    assert len(segments) == 3
+    assert "[Transcription failed - 00:00:00 - 00:00:05" in full_text
+    assert "[Transcription failed - 00:00:05 - 00:00:12" in full_text
+    # Unprobeable segment falls back to seg_seconds
+    assert "[Transcription failed - 00:00:12 - 00:00:22" in full_text
+
+
+def test_splitter_durations_skip_ffprobe(tmp_path, monkeypatch):
+    async def no_probe(path):
+        raise AssertionError("ffprobe should not be called")
+    monkeypatch.setattr(model_mod, "_probe_duration_async", no_probe)
+
+    def splitter(src, pattern, seg_secs):
+        for i in range(2):
+            (tmp_path / f"seg00{i}.mp3").write_bytes(b"")
+        return [4.0, 3.0]
+
+    full_text, segments = asyncio.run(transcribe_file(
+        FailingModel(),
+        mp3_full_path=str(tmp_path / "full.mp3"),
+        work_dir=str(tmp_path),
+        seg_seconds=10,
+        max_concurrency=2,
+        bypass_split=False,
+        splitter_fn=splitter,
+        max_segment_retries=0,
+        max_payload_size=10_000_000,
+        max_split_depth=3,
+    ))
+    assert len(segments) == 2
+    assert "[Transcription failed - 00:00:04 - 00:00:07" in full_text
+
+
+def test_read_segment_durations_from_csv(tmp_path):
+    from transcriber.audio import _read_segment_durations
+    (tmp_path / "segments.csv").write_text("seg000.mp3,0.000000,4.500000\nseg001.mp3,4.500000,6.000000\n")
+    assert _read_segment_durations(str(tmp_path / "seg%03d.mp3")) == [4.5, 1.5]
@@ -1,4 +1,4 @@
-from transcriber.utils import sanitize_filename
+from transcriber.utils import sanitize_filename, clean_some_unicode_from_text
 
 
 def test_sanitize_filename_reserved_chars():
@@ -21,3 +21,24 @@ def test_sanitize_filename_length_limit():
     long_name = 'a' * 300
     sanitized = sanitize_filename(long_name)
     assert len(sanitized) == 200
+
+
+def test_clean_unicode_strips_bidi_marks():
+    assert clean_some_unicode_from_text("\u200fשלום\u200b world\ufeff") == "שלום world"
+    plain = "plain ascii text"
+    assert clean_some_unicode_from_text(plain) is plain
+
+
+def test_sanitize_filename_clean_name_unchanged():
+    assert sanitize_filename("recording_2024_10_05.wav") == "recording_2024_10_05.wav"
+    assert sanitize_filename("הקלטה 12.m4a") == "הקלטה 12.m4a"
+    # Still normalized: repeated replacement, trailing dot, only-replacement
+    assert sanitize_filename("a__b") == "a_b"
+    assert sanitize_filename("name.") == "name"
+    assert sanitize_filename("___") == "file"
+
+
+def test_sanitize_filename_multichar_replacement_collapse():
+    assert sanitize_filename("a::b", replacement="ab") == "aabb"
+    assert sanitize_filename("abb", replacement="ab") == "abb"
+    assert sanitize_filename("xababy", replacement="ab") == "xaby"
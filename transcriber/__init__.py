@@ -4,13 +4,27 @@ Provides modular components for Drive audio transcription pipeline.
 """
 
 import logging
+import os
 
 # Package-wide logger. Modules should import `from . import logger` and use it.
 logger = logging.getLogger("transcriber")
-if not logger.handlers:
-    # Default basic configuration; Lambda/host may override
+
+
+def configure_logging() -> None:
+    """Attach the default stream handler/format to the package logger (idempotent).
+
+    Deferred out of import so tests/tools that never log don't pay for it;
+    entry points (CLI, Lambda) call this. Lambda/host may still override.
+    """
+    if any(not isinstance(h, logging.NullHandler) for h in logger.handlers):
+        return
     handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
-    handler.setFormatter(formatter)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
+
+
+if not logger.handlers:
+    logger.addHandler(logging.NullHandler())
+    if os.environ.get("LAMBDA_TASK_ROOT"):
+        configure_logging()
@@ -3,16 +3,25 @@ from __future__ import annotations
 import os
 import subprocess
 import shutil
-from typing import Optional
+from typing import List, Optional, Tuple
 from . import logger
 from .constants import ENV_FFMPEG_PATH, DEFAULT_FFMPEG_PATH
 
 FFMPEG_BIN: str = os.environ.get(ENV_FFMPEG_PATH, DEFAULT_FFMPEG_PATH)
 
+# One shared /dev/null handle for all ffmpeg/ffprobe calls instead of opening it per call.
+# On POSIX we also skip close_fds: the children are short-lived ffmpeg processes.
+try:
+    _DEVNULL = open(os.devnull, "wb")
+except OSError:
+    _DEVNULL = subprocess.DEVNULL
+_CLOSE_FDS: bool = os.name != "posix"
+
 
 def convert_to_mp3(input_path: str, output_path: str) -> None:
     """Convert any supported audio file to MP3 (libmp3lame).
 
+    ``-threads 0`` lets ffmpeg pick the thread count for decode/filtering.
     If the input is already an MP3, copy to the target path (if different).
     """
     ext = os.path.splitext(input_path)[1].lower()
@@ -26,8 +35,9 @@ def convert_to_mp3(input_path: str, output_path: str) -> None:
         return
     logger.info("Converting %s to mp3 -> %s", input_path, output_path)
     subprocess.check_call([
-        FFMPEG_BIN, "-y", "-i", input_path, "-vn", "-acodec", "libmp3lame", "-q:a", "2", output_path
-    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        FFMPEG_BIN, "-y", "-threads", "0", "-i", input_path,
+        "-vn", "-acodec", "libmp3lame", "-q:a", "2", output_path
+    ], stdout=_DEVNULL, stderr=_DEVNULL, close_fds=_CLOSE_FDS)
 
 
 # Backwards compatibility wrapper
@@ -36,36 +46,197 @@ def convert_m4a_to_mp3(m4a_path: str, mp3_path: str) -> None:
     convert_to_mp3(m4a_path, mp3_path)
 
 
-def split_mp3(mp3_path: str, out_pattern: str, seg_seconds: int) -> None:
-    """Split an MP3 into fixed-length segments using stream copy (no re-encode)."""
+def _segment_list_args(out_pattern: str) -> List[str]:
+    """ffmpeg segment-muxer args writing a CSV (name,start,end) next to the segments."""
+    return ["-segment_list", _segment_list_path(out_pattern), "-segment_list_type", "csv"]
+
+
+def _segment_list_path(out_pattern: str) -> str:
+    return os.path.join(os.path.dirname(out_pattern), "segments.csv")
+
+
+def _read_segment_durations(out_pattern: str) -> Optional[List[float]]:
+    """Return per-segment durations from the segment muxer's CSV list, or None if unavailable."""
+    durations: List[float] = []
+    try:
+        with open(_segment_list_path(out_pattern), "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.strip().rsplit(",", 2)
+                if len(parts) == 3:
+                    durations.append(max(0.0, float(parts[2]) - float(parts[1])))
+    except (OSError, ValueError):
+        return None
+    return durations or None
+
+
+def split_mp3(mp3_path: str, out_pattern: str, seg_seconds: int) -> Optional[List[float]]:
+    """Split an MP3 into fixed-length segments using stream copy (no re-encode).
+
+    Returns the segment durations reported by ffmpeg, or None if unavailable.
+    """
     logger.info("Splitting %s into %ds segments -> %s", mp3_path, seg_seconds, out_pattern)
     subprocess.check_call([
         FFMPEG_BIN, "-y", "-i", mp3_path,
         "-f", "segment", "-segment_time", str(seg_seconds),
+        *_segment_list_args(out_pattern),
         "-c", "copy", out_pattern
-    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    ], stdout=_DEVNULL, stderr=_DEVNULL, close_fds=_CLOSE_FDS)
+    return _read_segment_durations(out_pattern)
 
 
-def _get_bitrate_bits(mp3_path: str) -> Optional[int]:
+def convert_and_split(input_path: str, out_pattern: str, seg_seconds: int) -> Optional[List[float]]:
+    """Convert to MP3 and split into fixed-length segments in a single ffmpeg pass.
+
+    Reads/decodes the input once instead of running convert_to_mp3 followed by
+    split_mp3. MP3 inputs need no re-encode and are split with stream copy.
+    Returns the segment durations reported by ffmpeg, or None if unavailable.
+    """
+    if os.path.splitext(input_path)[1].lower() == ".mp3":
+        return split_mp3(input_path, out_pattern, seg_seconds)
+    logger.info("Converting %s to mp3 and splitting into %ds segments -> %s", input_path, seg_seconds, out_pattern)
+    subprocess.check_call([
+        FFMPEG_BIN, "-y", "-threads", "0", "-i", input_path,
+        "-vn", "-acodec", "libmp3lame", "-q:a", "2",
+        "-f", "segment", "-segment_time", str(seg_seconds),
+        *_segment_list_args(out_pattern), out_pattern
+    ], stdout=_DEVNULL, stderr=_DEVNULL, close_fds=_CLOSE_FDS)
+    return _read_segment_durations(out_pattern)
+
+
+# Typical average bitrate of libmp3lame -q:a 2 (VBR) output
+LAME_Q2_TYPICAL_BITRATE_BITS = 190_000
+
+
+def fused_segment_seconds(max_segment_size: int, fallback_seg_seconds: int) -> int:
+    """Segment length for convert_and_split targeting max_segment_size.
+
+    The encoded bitrate is unknown before the single ffmpeg pass runs, so the
+    typical -q:a 2 bitrate is assumed; the occasional oversize segment is
+    caught by the payload-error recursive split. Clamped like split_mp3_by_size.
+    """
+    duration_target = int((max_segment_size * 0.9) / (LAME_Q2_TYPICAL_BITRATE_BITS / 8.0))
+    return min(fallback_seg_seconds, max(30, duration_target))
+
+
+# MPEG audio Layer III lookup tables (kbps / Hz), indexed by header fields.
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+_MP3_SCAN_BYTES = 64 * 1024
+
+
+def _mp3_frame_info(buf: bytes, i: int) -> Optional[Tuple[int, int, int, int, int]]:
+    """Decode an MPEG Layer III frame header at ``buf[i]``.
+
+    Returns (version, bitrate_bits, sample_rate, frame_length, side_info_len),
+    or None if no valid header starts there.
+    """
+    if i < 0 or i + 4 > len(buf) or buf[i] != 0xFF:
+        return None
+    b1, b2, b3 = buf[i + 1], buf[i + 2], buf[i + 3]
+    version = (b1 >> 3) & 0x3
+    layer = (b1 >> 1) & 0x3
+    br_idx = b2 >> 4
+    sr_idx = (b2 >> 2) & 0x3
+    if (b1 & 0xE0) != 0xE0 or version == 1 or layer != 1 or not 0 < br_idx < 15 or sr_idx == 3:
+        return None
+    table = _MP3_BITRATES_V1 if version == 3 else _MP3_BITRATES_V2
+    bitrate = table[br_idx] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][sr_idx]
+    padding = (b2 >> 1) & 0x1
+    frame_length = (144 if version == 3 else 72) * bitrate // sample_rate + padding
+    mono = (b3 >> 6) == 3
+    if version == 3:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    return version, bitrate, sample_rate, frame_length, side_info
+
+
+def _parse_mp3_bitrate_bits(mp3_path: str) -> Optional[int]:
+    """Read the bitrate from the first MPEG Layer III frame header, or None.
+
+    Skips a leading ID3v2 tag. A sync is only trusted when another frame
+    header with the same version/sample rate follows at the computed frame
+    length. For VBR files the Xing header (frames + bytes) gives the average
+    bitrate; VBR files without those fields, with a VBRI header, or whose
+    second frame differs in bitrate return None so the caller can fall back
+    to ffprobe.
+    """
+    with open(mp3_path, "rb") as f:
+        head = f.read(10)
+        offset = 0
+        if len(head) == 10 and head[:3] == b"ID3":
+            size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            offset = 10 + size + (10 if head[5] & 0x10 else 0)
+        f.seek(offset)
+        buf = f.read(_MP3_SCAN_BYTES)
+    i = buf.find(b"\xff")
+    while 0 <= i <= len(buf) - 4:
+        info = _mp3_frame_info(buf, i)
+        nxt = _mp3_frame_info(buf, i + info[3]) if info else None
+        if info is None or nxt is None or nxt[0] != info[0] or nxt[2] != info[2]:
+            # Not a header, or a false sync in junk/tag data: keep scanning
+            i = buf.find(b"\xff", i + 1)
+            continue
+        version, frame_bits, sample_rate, _, side_info = info
+        tag_at = i + 4 + side_info
+        tag = buf[tag_at:tag_at + 4]
+        if tag == b"Xing":
+            flags = int.from_bytes(buf[tag_at + 4:tag_at + 8], "big")
+            if flags & 0x3 != 0x3:
+                return None
+            frames = int.from_bytes(buf[tag_at + 8:tag_at + 12], "big")
+            total_bytes = int.from_bytes(buf[tag_at + 12:tag_at + 16], "big")
+            samples_per_frame = 1152 if version == 3 else 576
+            if frames <= 0 or total_bytes <= 0:
+                return None
+            return int(total_bytes * 8 * sample_rate / (frames * samples_per_frame))
+        if buf[i + 36:i + 40] == b"VBRI":
+            return None
+        if nxt[1] != frame_bits:
+            # Bitrate changes between frames: VBR without a Xing header
+            return None
+        # No VBR header ("Info" or none) and a matching next frame: CBR
+        return frame_bits
+    return None
+
+
+def _probe_bitrate_bits(mp3_path: str) -> Optional[int]:
     """Return overall bitrate in bits/sec for an mp3 file using ffprobe, or None if unavailable."""
     try:
         out = subprocess.check_output([
             "ffprobe", "-v", "error", "-show_entries", "format=bit_rate",
             "-of", "default=noprint_wrappers=1:nokey=1", mp3_path
-        ], stderr=subprocess.DEVNULL).decode().strip()
+        ], stderr=_DEVNULL, close_fds=_CLOSE_FDS).decode().strip()
         return int(out)
     except Exception:
         logger.debug("Could not determine bitrate for %s", mp3_path)
         return None
 
 
-def split_mp3_by_size(mp3_path: str, out_pattern: str, max_segment_size: int, fallback_seg_seconds: int) -> None:
+def _get_bitrate_bits(mp3_path: str) -> Optional[int]:
+    """Return overall bitrate in bits/sec for an mp3 file, or None if unavailable.
+
+    Parses the MP3 frame header directly and only spawns ffprobe when that fails.
+    """
+    try:
+        bits = _parse_mp3_bitrate_bits(mp3_path)
+    except OSError:
+        bits = None
+    if bits:
+        return bits
+    return _probe_bitrate_bits(mp3_path)
+
+
+def split_mp3_by_size(mp3_path: str, out_pattern: str, max_segment_size: int, fallback_seg_seconds: int) -> Optional[List[float]]:
     """Split an MP3 into segments sized under a target byte ceiling.
 
     Approach: derive approximate segment duration from bitrate.
     If bitrate is unknown, fall back to provided seg_seconds.
 
     If the original file is already <= max_segment_size, emit a single seg000.mp3.
+    Returns the segment durations reported by ffmpeg when it split the file, else None.
     """
     if not os.path.exists(mp3_path):
         raise FileNotFoundError(mp3_path)
@@ -74,7 +245,7 @@ def split_mp3_by_size(mp3_path: str, out_pattern: str, max_segment_size: int, fa
         single_out = out_pattern.replace("%03d", "000")
         shutil.copyfile(mp3_path, single_out)
         logger.debug("File %s already <= max_segment_size (%d bytes); copied to %s", mp3_path, raw_size, single_out)
-        return
+        return None
     bitrate_bits = _get_bitrate_bits(mp3_path)
     SAFETY = 0.9
     if bitrate_bits and bitrate_bits > 0:
@@ -95,5 +266,7 @@ def split_mp3_by_size(mp3_path: str, out_pattern: str, max_segment_size: int, fa
     subprocess.check_call([
         FFMPEG_BIN, "-y", "-i", mp3_path,
         "-f", "segment", "-segment_time", str(duration_target),
+        *_segment_list_args(out_pattern),
         "-c", "copy", out_pattern
-    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    ], stdout=_DEVNULL, stderr=_DEVNULL, close_fds=_CLOSE_FDS)
+    return _read_segment_durations(out_pattern)
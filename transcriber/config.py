@@ -7,9 +7,12 @@ variables to keep local and Lambda execution identical.
 from __future__ import annotations
 import os
 import json
-from dataclasses import dataclass
+import functools
+import itertools
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 import datetime as _dt
+from zoneinfo import ZoneInfo
 
 from .constants import (
     ENV_SERVICE_ACCOUNT_FILE,
@@ -25,9 +28,11 @@ from .constants import (
     ENV_RUNPOD_ENDPOINT_ID,
     ENV_CONFIG_PATH,
     ENV_MAX_SEGMENT_CONCURRENCY,
+    ENV_MAX_FILE_CONCURRENCY,
     ENV_SEG_SECONDS,
     ENV_SKIP_DRIVE,
     ENV_BYPASS_SPLIT,
+    ENV_FUSED_CONVERT_SPLIT,
     ENV_TIME_WINDOW_ENABLED,
     ENV_SCHEDULE_START_HOUR,
     ENV_SCHEDULE_END_HOUR,
@@ -47,10 +52,34 @@ from .constants import (
     # Transcription language selection
     ENV_TRANSCRIPTION_LANGUAGE,
     DEFAULT_TRANSCRIPTION_LANGUAGE,
+    DEFAULT_MAX_SEGMENT_CONCURRENCY,
+    DEFAULT_MAX_FILE_CONCURRENCY,
+    DEFAULT_SEG_SECONDS,
+    DEFAULT_TIME_WINDOW_ENABLED,
+    DEFAULT_SCHEDULE_START_HOUR,
+    DEFAULT_SCHEDULE_END_HOUR,
+    DEFAULT_SCHEDULE_DAYS,
+    DEFAULT_SCHEDULE_TIMEZONE,
+    DEFAULT_ADD_RANDOM_PERSONAL_MESSAGE,
+    DEFAULT_MAX_SEGMENT_RETRIES,
+    DEFAULT_BALANCE_ALERT_VALUE,
+    DEFAULT_MAX_PAYLOAD_SIZE,
+    DEFAULT_MAX_SPLIT_DEPTH,
+    DEFAULT_MAX_SEGMENT_SIZE,
+    DEFAULT_FUSED_CONVERT_SPLIT,
 )
 
-from dotenv import load_dotenv
-load_dotenv()
+# Load the repo-root .env once per process. Lambda never ships a .env, so skip
+# the dotenv import/stat there entirely; elsewhere only parse an existing file.
+if "AWS_LAMBDA_FUNCTION_NAME" not in os.environ and not os.environ.get("_DOTENV_LOADED"):
+    try:
+        from dotenv import load_dotenv
+        _dotenv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".env")
+        if os.path.isfile(_dotenv_path):
+            load_dotenv(_dotenv_path)
+    except Exception:
+        pass
+    os.environ["_DOTENV_LOADED"] = "1"
 
 # Default config path: env override or repo root config.json
 DEFAULT_CONFIG_PATH = os.environ.get(
@@ -59,7 +88,41 @@ DEFAULT_CONFIG_PATH = os.environ.get(
 )
 
 
-@dataclass
+# Weekday index (datetime.weekday()) <-> schedule label
+_IDX_TO_LABEL = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+_LABEL_TO_IDX = {label: i for i, label in enumerate(_IDX_TO_LABEL)}
+_UTC_ALIASES = frozenset({"UTC", "ETC/UTC", "GMT", "Z"})
+
+
+@functools.lru_cache(maxsize=None)
+def _zone(name: str) -> _dt.tzinfo:
+    """Return a cached tzinfo for an IANA timezone name; UTC aliases and unknown zones map to UTC."""
+    if name.upper() in _UTC_ALIASES:
+        return _dt.timezone.utc
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return _dt.timezone.utc
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_schedule_days(spec: str) -> Optional[frozenset]:
+    """Parse a day range like SUN-THU into weekday indexes; None if labels are invalid."""
+    parts = spec.split('-')
+    if len(parts) == 1:
+        start_label = end_label = parts[0]
+    else:
+        start_label, end_label = parts[0], parts[-1]
+    start_idx = _LABEL_TO_IDX.get(start_label)
+    end_idx = _LABEL_TO_IDX.get(end_label)
+    if start_idx is None or end_idx is None:
+        return None
+    if start_idx <= end_idx:
+        return frozenset(range(start_idx, end_idx + 1))
+    return frozenset(list(range(start_idx, 7)) + list(range(0, end_idx + 1)))
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Strongly-typed configuration values consumed by the pipeline."""
     service_account_file: Optional[str]
@@ -75,9 +138,11 @@ class Config:
     runpod_endpoint_id: Optional[str]
     config_path: str
     max_segment_concurrency: int
+    max_file_concurrency: int  # how many Drive files are processed concurrently
     seg_seconds: int
     skip_drive: bool
     bypass_split: bool
+    fused_convert_split: bool  # convert + split non-MP3 inputs in a single ffmpeg pass
     time_window_enabled: bool
     schedule_start_hour: int
     schedule_end_hour: int
@@ -92,126 +157,152 @@ class Config:
     max_segment_size: int       # initial segmentation size cap in bytes (default 8MB)
     transcription_language: str
 
+    # Derived in __post_init__ so within_schedule_window does no parsing per call
+    _allowed_days: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _tz: Optional[_dt.tzinfo] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_allowed_days", _parse_schedule_days(self.schedule_days))
+        object.__setattr__(self, "_tz", _zone(self.timezone))
+
     @property
     def within_schedule_window(self) -> bool:
         """Return True if current local time is within configured schedule window.
 
         - If time-window enforcement is disabled, always returns True.
-        - Day range specified via labels like SUN-SAT.
-        - Uses zoneinfo if available; falls back to UTC.
+        - Day range specified via labels like SUN-SAT (invalid labels disable the check).
+        - Uses zoneinfo; unknown zones fall back to UTC.
         """
         if not self.time_window_enabled:
             return True
-        now: _dt.datetime
-        try:
-            from zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # Python 3.9+
-            tz_key = self.timezone
-            if tz_key.upper() in {"UTC", "ETC/UTC", "GMT", "Z"}:
-                tz_key = "UTC"
-            try:
-                tz = ZoneInfo(tz_key)
-                now = _dt.datetime.now(tz)
-            except ZoneInfoNotFoundError:
-                # Fallback: use timezone-aware UTC now (Python 3.12+)
-                now = _dt.datetime.now(_dt.UTC)
-        except Exception:
-            now = _dt.datetime.now(_dt.UTC)
-        label_for = {0: "MON", 1: "TUE", 2: "WED", 3: "THU", 4: "FRI", 5: "SAT", 6: "SUN"}
-        idx_for = {v: k for k, v in label_for.items()}
-        parts = self.schedule_days.split('-')
-        if len(parts) == 1:
-            start_label = end_label = parts[0]
-        else:
-            start_label, end_label = parts[0], parts[-1]
-        if start_label not in idx_for or end_label not in idx_for:
+        allowed_days = self._allowed_days
+        if allowed_days is None:
             return True
-        start_idx = idx_for[start_label]; end_idx = idx_for[end_label]
-        if start_idx <= end_idx:
-            allowed_days = set(range(start_idx, end_idx + 1))
-        else:
-            allowed_days = set(list(range(start_idx, 7)) + list(range(0, end_idx + 1)))
+        now = _dt.datetime.now(self._tz)
         if now.weekday() not in allowed_days:
             return False
-        if not (self.schedule_start_hour <= now.hour <= self.schedule_end_hour):
-            return False
+        return self.schedule_start_hour <= now.hour <= self.schedule_end_hour
+
+
+def _case_variants(word: str) -> set[str]:
+    return {"".join(chars) for chars in itertools.product(*({c.lower(), c.upper()} for c in word))}
+
+
+# Every casing of the falsy synonyms, so exact-match lookups need no case folding.
+_FALSY = frozenset().union(*(_case_variants(w) for w in ("0", "false", "no", "off")))
+_TRUTHY = frozenset().union(*(_case_variants(w) for w in ("1", "true", "yes", "on")))
+
+
+def _as_bool(val: str) -> bool:
+    """Interpret a present env value: 0, false, no, off -> False, anything else -> True."""
+    if val in _FALSY:
+        return False
+    if val in _TRUTHY:
         return True
+    # Slow path only for unusual values, e.g. surrounded by whitespace
+    return val.strip().lower() not in _FALSY
+
 
+def _is_one(val: str) -> bool:
+    """Strict flag parsing used by legacy toggles: only "1" enables."""
+    return val == "1"
 
-def _parse_bool_env(key: str, default_true: bool = False) -> bool:
-    """Parse an environment variable into boolean with common falsy synonyms.
 
-    Accepts: 0, false, no, off -> False, anything else -> True when present.
-    When absent, returns default_true.
+def _smtp_port(val: str) -> int:
+    try:
+        return int(val)
+    except ValueError:
+        return DEFAULT_SMTP_PORT
+
+
+# Env-backed Config fields: (attribute, env var, caster, value when unset).
+# The caster is applied only to values present in the environment.
+_SCHEMA = (
+    ("service_account_file", ENV_SERVICE_ACCOUNT_FILE, str, None),
+    ("drive_folder_id", ENV_DRIVE_FOLDER_ID, str, None),
+    ("email_to", ENV_EMAIL_TO, str, None),
+    ("gmail_sender_email", ENV_GMAIL_SENDER_EMAIL, str, None),
+    ("gmail_app_password", ENV_GMAIL_APP_PASSWORD, str, None),
+    # Generic SMTP settings with Gmail-compatible defaults
+    ("smtp_server", ENV_SMTP_SERVER, str, DEFAULT_SMTP_SERVER),
+    ("smtp_port", ENV_SMTP_PORT, _smtp_port, DEFAULT_SMTP_PORT),
+    ("smtp_use_ssl", ENV_SMTP_USE_SSL, _as_bool, DEFAULT_SMTP_USE_SSL),
+    ("runpod_api_key", ENV_RUNPOD_API_KEY, str, None),
+    ("runpod_endpoint_id", ENV_RUNPOD_ENDPOINT_ID, str, None),
+    ("max_segment_concurrency", ENV_MAX_SEGMENT_CONCURRENCY, int, DEFAULT_MAX_SEGMENT_CONCURRENCY),
+    ("max_file_concurrency", ENV_MAX_FILE_CONCURRENCY, int, DEFAULT_MAX_FILE_CONCURRENCY),
+    ("seg_seconds", ENV_SEG_SECONDS, int, DEFAULT_SEG_SECONDS),
+    ("skip_drive", ENV_SKIP_DRIVE, _is_one, False),
+    ("bypass_split", ENV_BYPASS_SPLIT, _is_one, False),
+    ("fused_convert_split", ENV_FUSED_CONVERT_SPLIT, _is_one, DEFAULT_FUSED_CONVERT_SPLIT),
+    ("time_window_enabled", ENV_TIME_WINDOW_ENABLED, _is_one, DEFAULT_TIME_WINDOW_ENABLED),
+    ("schedule_start_hour", ENV_SCHEDULE_START_HOUR, int, DEFAULT_SCHEDULE_START_HOUR),
+    ("schedule_end_hour", ENV_SCHEDULE_END_HOUR, int, DEFAULT_SCHEDULE_END_HOUR),
+    ("schedule_days", ENV_SCHEDULE_DAYS, str, DEFAULT_SCHEDULE_DAYS),
+    ("timezone", ENV_SCHEDULE_TIMEZONE, str, DEFAULT_SCHEDULE_TIMEZONE),
+    ("add_random_personal_message", ENV_ADD_RANDOM_PERSONAL_MESSAGE, _as_bool, DEFAULT_ADD_RANDOM_PERSONAL_MESSAGE),
+    ("max_segment_retries", ENV_MAX_SEGMENT_RETRIES, int, DEFAULT_MAX_SEGMENT_RETRIES),
+    ("balance_alert_value", ENV_BALANCE_ALERT_VALUE, float, DEFAULT_BALANCE_ALERT_VALUE),
+    ("max_payload_size", ENV_MAX_PAYLOAD_SIZE, int, DEFAULT_MAX_PAYLOAD_SIZE),
+    ("max_split_depth", ENV_MAX_SPLIT_DEPTH, int, DEFAULT_MAX_SPLIT_DEPTH),
+    ("max_segment_size", ENV_MAX_SEGMENT_SIZE, int, DEFAULT_MAX_SEGMENT_SIZE),
+    # Any key present in the config languages mapping is allowed
+    ("transcription_language", ENV_TRANSCRIPTION_LANGUAGE, str, DEFAULT_TRANSCRIPTION_LANGUAGE),
+)
+
+# Every env var consulted by load_config. Their current values form part of the
+# cache key, so overriding/monkeypatching any of them invalidates automatically.
+_CONFIG_ENV_KEYS = tuple(key for _, key, _, _ in _SCHEMA)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_languages(cfg_path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, Any]]:
+    """Read the languages mapping from a JSON config file.
+
+    Cached per (path, mtime, size) so an unchanged file is never re-read or re-parsed.
     """
-    val = os.environ.get(key)
-    if val is None:
-        return default_true
-    val_norm = val.strip().lower()
-    if val_norm in {"0", "false", "no", "off"}:
-        return False
-    return True
+    try:
+        with open(cfg_path, 'r', encoding='utf-8') as f:
+            file_cfg = json.load(f)
+        return file_cfg.get('languages', {})
+    except Exception:
+        return {}
+
+
+@functools.lru_cache(maxsize=32)
+def _build_config(env_snapshot: tuple, cfg_path: str, file_sig: Optional[tuple]) -> Config:
+    """Build a Config from a snapshot of the env vars listed in _SCHEMA (cached)."""
+    values = {
+        attr: default if raw is None else caster(raw)
+        for (attr, _, caster, default), raw in zip(_SCHEMA, env_snapshot)
+    }
+    languages = _load_languages(cfg_path, *file_sig) if file_sig is not None else {}
+    return Config(**values, config_path=cfg_path, languages=languages)
 
 
 def load_config(path: Optional[str] = None) -> Config:
     """Load configuration by merging environment variables and config.json.
 
     The JSON file is used for language mapping and similar structured config,
-    while scalar toggles come from env vars for easy overrides.
+    while scalar toggles come from env vars for easy overrides. Results are
+    cached on (relevant env values, config path, config mtime/size), so repeated
+    calls are cheap and still reflect env/file changes.
     """
     cfg_path = path or DEFAULT_CONFIG_PATH
-    languages: Dict[str, Dict[str, Any]] = {}
-    if os.path.exists(cfg_path):
-        try:
-            with open(cfg_path, 'r', encoding='utf-8') as f:
-                file_cfg = json.load(f)
-            languages = file_cfg.get('languages', {})
-        except Exception:
-            languages = {}
-    # Parse SMTP settings with sensible defaults pointing at Gmail but overridable
-    smtp_server = os.environ.get(ENV_SMTP_SERVER, DEFAULT_SMTP_SERVER)
     try:
-        smtp_port = int(os.environ.get(ENV_SMTP_PORT, str(DEFAULT_SMTP_PORT)))
-    except ValueError:
-        smtp_port = DEFAULT_SMTP_PORT
-    # If SMTP_USE_SSL is not set, default to DEFAULT_SMTP_USE_SSL
-    smtp_use_ssl_env = os.environ.get(ENV_SMTP_USE_SSL)
-    if smtp_use_ssl_env is None:
-        smtp_use_ssl = DEFAULT_SMTP_USE_SSL
-    else:
-        smtp_use_ssl = smtp_use_ssl_env.strip().lower() not in {"0", "false", "no", "off"}
-
-    # Decide which language key to use for transcription.
-    # Default is English ("en") for international users, but any key present
-    # in the config languages mapping is allowed.
-    transcription_language = os.environ.get(ENV_TRANSCRIPTION_LANGUAGE, DEFAULT_TRANSCRIPTION_LANGUAGE)
-
-    return Config(
-        service_account_file=os.environ.get(ENV_SERVICE_ACCOUNT_FILE),
-        drive_folder_id=os.environ.get(ENV_DRIVE_FOLDER_ID),
-        email_to=os.environ.get(ENV_EMAIL_TO),
-        gmail_sender_email=os.environ.get(ENV_GMAIL_SENDER_EMAIL),
-        gmail_app_password=os.environ.get(ENV_GMAIL_APP_PASSWORD),
-        smtp_server=smtp_server,
-        smtp_port=smtp_port,
-        smtp_use_ssl=smtp_use_ssl,
-        runpod_api_key=os.environ.get(ENV_RUNPOD_API_KEY),
-        runpod_endpoint_id=os.environ.get(ENV_RUNPOD_ENDPOINT_ID),
-        config_path=cfg_path,
-        max_segment_concurrency=int(os.environ.get(ENV_MAX_SEGMENT_CONCURRENCY, "2")),
-        seg_seconds=int(os.environ.get(ENV_SEG_SECONDS, str(8 * 60))),
-        skip_drive=os.environ.get(ENV_SKIP_DRIVE) == "1",
-        bypass_split=os.environ.get(ENV_BYPASS_SPLIT) == "1",
-        time_window_enabled=os.environ.get(ENV_TIME_WINDOW_ENABLED, "1") == "1",
-        schedule_start_hour=int(os.environ.get(ENV_SCHEDULE_START_HOUR, "8")),
-        schedule_end_hour=int(os.environ.get(ENV_SCHEDULE_END_HOUR, "22")),
-        schedule_days=os.environ.get(ENV_SCHEDULE_DAYS, "SUN-SAT"),
-        timezone=os.environ.get(ENV_SCHEDULE_TIMEZONE, "UTC"),
-        add_random_personal_message=_parse_bool_env(ENV_ADD_RANDOM_PERSONAL_MESSAGE, default_true=True),
-        languages=languages,
-        max_segment_retries=int(os.environ.get(ENV_MAX_SEGMENT_RETRIES, "2")),
-        balance_alert_value=float(os.environ.get(ENV_BALANCE_ALERT_VALUE, "2")),
-        max_payload_size=int(os.environ.get(ENV_MAX_PAYLOAD_SIZE, str(9 * 1024 * 1024))),
-        max_split_depth=int(os.environ.get(ENV_MAX_SPLIT_DEPTH, "3")),
-        max_segment_size=int(os.environ.get(ENV_MAX_SEGMENT_SIZE, str(8 * 1024 * 1024))),
-        transcription_language=transcription_language,
-    )
\ No newline at end of file
+        st = os.stat(cfg_path)
+        file_sig: Optional[tuple] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_sig = None
+    env = os.environ
+    env_snapshot = tuple(env.get(k) for k in _CONFIG_ENV_KEYS)
+    return _build_config(env_snapshot, cfg_path, file_sig)
+
+
+def _clear_config_cache() -> None:
+    """Drop cached Config instances and parsed config files."""
+    _build_config.cache_clear()
+    _load_languages.cache_clear()
+
+
+load_config.cache_clear = _clear_config_cache  # type: ignore[attr-defined]
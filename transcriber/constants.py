@@ -19,9 +19,11 @@ ENV_RUNPOD_API_KEY = "RUNPOD_API_KEY"
 ENV_RUNPOD_ENDPOINT_ID = "RUNPOD_ENDPOINT_ID"
 ENV_CONFIG_PATH = "CONFIG_PATH"
 ENV_MAX_SEGMENT_CONCURRENCY = "MAX_SEGMENT_CONCURRENCY"
+ENV_MAX_FILE_CONCURRENCY = "MAX_FILE_CONCURRENCY"
 ENV_SEG_SECONDS = "SEG_SECONDS"
 ENV_SKIP_DRIVE = "SKIP_DRIVE"
 ENV_BYPASS_SPLIT = "BYPASS_SPLIT"
+ENV_FUSED_CONVERT_SPLIT = "FUSED_CONVERT_SPLIT"
 ENV_TIME_WINDOW_ENABLED = "TIME_WINDOW_ENABLED"
 ENV_SCHEDULE_START_HOUR = "SCHEDULE_START_HOUR"
 ENV_SCHEDULE_END_HOUR = "SCHEDULE_END_HOUR"
@@ -46,9 +48,11 @@ DEFAULT_CONFIG_PATH_REL = "config.json"
 DEFAULT_AUDIO_EXTENSIONS = ".m4a,.wav,.mp3,.ogg,.flac,.aac,.wma,.m4b,.aiff,.aif,.opus"
 DEFAULT_FFMPEG_PATH = "ffmpeg"  # overridden to /opt/bin/ffmpeg in Lambda via env
 DEFAULT_MAX_SEGMENT_CONCURRENCY = 2
+DEFAULT_MAX_FILE_CONCURRENCY = 1  # Drive files processed in parallel per run (opt-in above 1)
 DEFAULT_SEG_SECONDS = 8 * 60
 DEFAULT_SKIP_DRIVE = False
 DEFAULT_BYPASS_SPLIT = False
+DEFAULT_FUSED_CONVERT_SPLIT = False  # one ffmpeg pass for non-MP3 inputs (opt-in)
 DEFAULT_TIME_WINDOW_ENABLED = True
 DEFAULT_SCHEDULE_START_HOUR = 8
 DEFAULT_SCHEDULE_END_HOUR = 22
@@ -2,7 +2,8 @@
 from __future__ import annotations
 import os
 import io
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Dict, List, Optional, Tuple
 from google.oauth2 import service_account
 from google.auth import default
 from google.auth.transport.requests import Request as AuthRequest
@@ -13,57 +14,82 @@ from googleapiclient.errors import HttpError
 from . import logger
 from .constants import ENV_AUDIO_EXTENSIONS, DEFAULT_AUDIO_EXTENSIONS
 
-PROCESSED_FOLDER_ID_CACHE: Optional[str] = None
+# Media download chunk size; the library default (100KB) costs one HTTPS round-trip per chunk
+DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+# (Drive client, credentials) per resolved service account path (None = ADC)
+_DRIVE_SERVICE_CACHE: Dict[Optional[str], Tuple[Any, Any]] = {}
+
+# 'processed' subfolder ID per parent folder ID (avoids a Drive list call per file)
+_PROCESSED_FOLDER_CACHE: Dict[str, str] = {}
 
 # Configurable audio extensions (comma-separated). Evaluate at import-time so tests can reload after monkeypatching env.
 AUDIO_EXTENSIONS = {
     e if e.startswith('.') else f'.{e}'
     for e in (os.environ.get(ENV_AUDIO_EXTENSIONS, DEFAULT_AUDIO_EXTENSIONS).lower().split(',')) if e.strip()
 }
+# str.endswith accepts a tuple, matching all extensions in one C-level call
+_AUDIO_EXT_TUPLE = tuple(AUDIO_EXTENSIONS)
+
+# Fallback service account locations, computed once at import
+_SA_CANDIDATE_BASES = (
+    os.path.join(os.path.dirname(__file__), "sa.json"),
+    os.path.join(os.getcwd(), "sa.json"),
+    "sa.json",
+)
 
 
+@functools.lru_cache(maxsize=8)
 def _resolve_service_account_path(service_account_file: Optional[str]) -> Optional[str]:
-    """Locate a service account JSON file from common search locations."""
-    candidates = []
-    if service_account_file:
-        candidates.append(service_account_file)
-    candidates.extend([
-        os.path.join(os.path.dirname(__file__), "sa.json"),
-        os.path.join(os.getcwd(), "sa.json"),
-        "sa.json",
-    ])
-    for p in candidates:
+    """Locate a service account JSON file from common search locations (cached)."""
+    for p in (service_account_file, *_SA_CANDIDATE_BASES):
         if p and os.path.exists(p):
             return p
     return None
 
 
 def drive_service(skip_drive: bool, service_account_file: Optional[str]):
-    """Return an authenticated Drive service client or None if drive is skipped."""
+    """Return an authenticated Drive service client or None if drive is skipped.
+
+    Clients are cached per credential source so warm invocations skip the key
+    parse and client build; credentials are refreshed only once expired.
+    """
     if skip_drive:
         return None
-    scopes = ["https://www.googleapis.com/auth/drive"]
     sa_path = _resolve_service_account_path(service_account_file)
+    cached = _DRIVE_SERVICE_CACHE.get(sa_path)
+    if cached is not None:
+        service, creds = cached
+        if creds.expired:
+            try:
+                creds.refresh(AuthRequest())
+            except GoogleAuthError as e:
+                raise RuntimeError(f"Credential refresh failed: {e}")
+        return service
+    scopes = ["https://www.googleapis.com/auth/drive"]
     if sa_path:
         creds = service_account.Credentials.from_service_account_file(sa_path, scopes=scopes)
         logger.info("Using service account for Drive: %s", sa_path)
-        return build("drive", "v3", credentials=creds, cache_discovery=False)
-    try:
-        creds, _ = default(scopes=scopes)
-    except Exception as e:
-        raise RuntimeError(f"ADC credential load failed: {e}")
-    try:
-        if not creds.valid:
-            creds.refresh(AuthRequest())
-    except GoogleAuthError as e:
-        raise RuntimeError(f"Credential refresh failed: {e}")
-    return build("drive", "v3", credentials=creds, cache_discovery=False)
+    else:
+        try:
+            creds, _ = default(scopes=scopes)
+        except Exception as e:
+            raise RuntimeError(f"ADC credential load failed: {e}")
+        try:
+            if not creds.valid:
+                creds.refresh(AuthRequest())
+        except GoogleAuthError as e:
+            raise RuntimeError(f"Credential refresh failed: {e}")
+    service = build("drive", "v3", credentials=creds, cache_discovery=False)
+    _DRIVE_SERVICE_CACHE[sa_path] = (service, creds)
+    return service
 
 
 def list_audio_files(service, drive_folder_id: str, skip_drive: bool) -> List[Dict[str, Any]]:
     """List audio files with configured extensions in given Drive folder.
 
-    Broad query is used then filtered locally by AUDIO_EXTENSIONS.
+    Broad query is used then filtered locally by AUDIO_EXTENSIONS. All result
+    pages are fetched (1000 per request), oldest first.
     """
     if skip_drive:
         return []
@@ -72,18 +98,24 @@ def list_audio_files(service, drive_folder_id: str, skip_drive: bool) -> List[Di
         "and mimeType != 'application/vnd.google-apps.folder' "
         "and trashed = false"
     )
+    files: List[Dict[str, Any]] = []
+    page_token: Optional[str] = None
     try:
-        res = service.files().list(q=q, fields="files(id,name,createdTime)").execute()
+        while True:
+            res = service.files().list(
+                q=q,
+                fields="nextPageToken, files(id,name,createdTime)",
+                pageSize=1000,
+                orderBy="createdTime",
+                pageToken=page_token,
+            ).execute()
+            files.extend(res.get("files", []))
+            page_token = res.get("nextPageToken")
+            if not page_token:
+                break
     except HttpError as e:
         raise RuntimeError(f"Drive list error: {e}")
-    files = res.get("files", [])
-    out: List[Dict[str, Any]] = []
-    for f in files:
-        name = f.get("name", "")
-        ext = os.path.splitext(name)[1].lower()
-        if ext in AUDIO_EXTENSIONS:
-            out.append(f)
-    return out
+    return [f for f in files if f.get("name", "").lower().endswith(_AUDIO_EXT_TUPLE)]
 
 
 # Backward compatibility: old function now delegates to new generic version but limits to .m4a
@@ -99,13 +131,17 @@ def list_m4a_files(service, drive_folder_id: str, skip_drive: bool):
 def download_file(service, file_id: str, dst_path: str, skip_drive: bool) -> None:
     if skip_drive:
         return
-    fh = io.FileIO(dst_path, mode="wb")
     request = service.files().get_media(fileId=file_id)
-    downloader = MediaIoBaseDownload(fh, request)
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
-    fh.close()
+    with io.FileIO(dst_path, mode="wb") as fh:
+        downloader = MediaIoBaseDownload(fh, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+        done = False
+        while not done:
+            status, done = downloader.next_chunk()
+
+
+def clear_processed_folder_cache() -> None:
+    """Forget cached 'processed' folder IDs (e.g. after folders were moved/deleted)."""
+    _PROCESSED_FOLDER_CACHE.clear()
 
 
 def get_or_create_processed_folder(
@@ -115,9 +151,9 @@ def get_or_create_processed_folder(
 ) -> Optional[str]:
     if skip_drive:
         return None
-    global PROCESSED_FOLDER_ID_CACHE
-    if PROCESSED_FOLDER_ID_CACHE:
-        return PROCESSED_FOLDER_ID_CACHE
+    cached = _PROCESSED_FOLDER_CACHE.get(parent_folder_id)
+    if cached:
+        return cached
     folder_name = "processed"
     q = (
         f"'{parent_folder_id}' in parents and name = '{folder_name}' "
@@ -128,7 +164,7 @@ def get_or_create_processed_folder(
         items = res.get('files', [])
         if items:
             folder_id = items[0]['id']
-            PROCESSED_FOLDER_ID_CACHE = folder_id
+            _PROCESSED_FOLDER_CACHE[parent_folder_id] = folder_id
             return folder_id
     except HttpError as e:
         logger.warning(
@@ -144,7 +180,7 @@ def get_or_create_processed_folder(
         }
         folder = service.files().create(body=folder_metadata, fields='id').execute()
         folder_id = folder.get('id')
-        PROCESSED_FOLDER_ID_CACHE = folder_id
+        _PROCESSED_FOLDER_CACHE[parent_folder_id] = folder_id
         logger.info("Created 'processed' folder with ID: %s", folder_id)
         return folder_id
     except HttpError as e:
@@ -2,79 +2,153 @@
 import os
 import ssl
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+import threading
+from email.message import EmailMessage
 from . import logger
 from .config import Config
 
 
-def send_transcription_email(
-    gmail_app_password: str | None,
-    gmail_sender_email: str | None,
-    email_to: str | None,
+# Gmail caps messages per SMTP connection; reconnect well before that
+SMTP_MAX_MESSAGES_PER_CONNECTION = 50
+
+
+def _build_message(
+    gmail_sender_email: str,
+    email_to: str,
     subject: str,
     body_text: str,
     attachment_path: str | None,
-    *,
-    config: Config | None = None,
-):
-    """Send the transcription email.
-
-    SMTP server, port and SSL usage are taken from the provided Config when
-    available, falling back to Gmail-compatible defaults inside Config. This
-    keeps the function backward compatible for existing callers that do not
-    pass a Config instance while allowing other SMTP providers via env vars.
-    """
-    if not gmail_app_password or not gmail_sender_email or not email_to:
-        logger.info("Missing email configuration; skipping email.")
-        return False
-
-    message = MIMEMultipart()
+) -> EmailMessage:
+    message = EmailMessage()
     message["From"] = gmail_sender_email
     message["To"] = email_to
     message["Subject"] = subject
-    message.attach(MIMEText(body_text, "plain", "utf-8"))
+    message.set_content(body_text, charset="utf-8")
 
     if attachment_path and os.path.exists(attachment_path):
-        part = MIMEBase('application', 'octet-stream')
-        with open(attachment_path, 'rb') as f:
-            part.set_payload(f.read())
-        encoders.encode_base64(part)
-        part.add_header('Content-Disposition', f'attachment; filename="{os.path.basename(attachment_path)}"')
-        message.attach(part)
-
-    # Decide SMTP connection parameters
-    smtp_server = getattr(config, "smtp_server", "smtp.gmail.com")
-    smtp_port = int(getattr(config, "smtp_port", 465))
-    smtp_use_ssl = bool(getattr(config, "smtp_use_ssl", True))
-
-    context = ssl.create_default_context()
-    try:
-        if smtp_use_ssl:
+        filename = os.path.basename(attachment_path)
+        if filename.lower().endswith(".txt"):
+            # Transcripts are text: attach as text/plain instead of an opaque binary blob
+            with open(attachment_path, 'r', encoding='utf-8', errors='replace') as f:
+                message.add_attachment(f.read(), subtype="plain", charset="utf-8", filename=filename)
+        else:
+            with open(attachment_path, 'rb') as f:
+                message.add_attachment(f.read(), maintype="application", subtype="octet-stream", filename=filename)
+    return message
+
+
+class GmailSender:
+    """SMTP session reused across several emails (one TLS handshake + LOGIN).
+
+    Connects lazily on the first send, reconnects after
+    ``max_messages_per_connection`` messages or when the server dropped an idle
+    connection. ``send`` is thread-safe; use as a context manager to close.
+    """
+
+    def __init__(
+        self,
+        gmail_sender_email: str | None,
+        gmail_app_password: str | None,
+        *,
+        config: Config | None = None,
+        max_messages_per_connection: int = SMTP_MAX_MESSAGES_PER_CONNECTION,
+    ):
+        self.gmail_sender_email = gmail_sender_email
+        self.gmail_app_password = gmail_app_password
+        # SMTP server, port and SSL usage come from Config when available,
+        # falling back to Gmail-compatible defaults.
+        self.smtp_server = getattr(config, "smtp_server", "smtp.gmail.com")
+        self.smtp_port = int(getattr(config, "smtp_port", 465))
+        self.smtp_use_ssl = bool(getattr(config, "smtp_use_ssl", True))
+        self.max_messages_per_connection = max(1, max_messages_per_connection)
+        self._server: smtplib.SMTP | None = None
+        self._sent_on_connection = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GmailSender":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        context = ssl.create_default_context()
+        if self.smtp_use_ssl:
             # Direct SSL (typical for port 465 and Gmail-style endpoints)
-            with smtplib.SMTP_SSL(smtp_server, smtp_port, context=context) as server:
-                server.login(gmail_sender_email, gmail_app_password)
-                server.sendmail(gmail_sender_email, email_to, message.as_string())
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, context=context)
         else:
             # Plain connection upgraded with STARTTLS (typical for port 587)
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server.ehlo()
+            try:
+                server.starttls(context=context)
                 server.ehlo()
+            except smtplib.SMTPException:
+                # Some providers expect plain-text only; continue without STARTTLS.
+                pass
+        try:
+            server.login(self.gmail_sender_email, self.gmail_app_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def close(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                server.close()
+
+    def _send_locked(self, message: EmailMessage, email_to: str) -> None:
+        if self._server is None or self._sent_on_connection >= self.max_messages_per_connection:
+            self.close()
+            self._server = self._connect()
+            self._sent_on_connection = 0
+        self._server.send_message(message, from_addr=self.gmail_sender_email, to_addrs=email_to)
+        self._sent_on_connection += 1
+
+    def send(self, email_to: str | None, subject: str, body_text: str, attachment_path: str | None) -> bool:
+        """Send one transcription email; returns False (and logs) on failure."""
+        if not self.gmail_app_password or not self.gmail_sender_email or not email_to:
+            logger.info("Missing email configuration; skipping email.")
+            return False
+        message = _build_message(self.gmail_sender_email, email_to, subject, body_text, attachment_path)
+        with self._lock:
+            try:
                 try:
-                    server.starttls(context=context)
-                    server.ehlo()
-                except smtplib.SMTPException:
-                    # Some providers expect plain-text only; continue without STARTTLS.
-                    pass
-                server.login(gmail_sender_email, gmail_app_password)
-                server.sendmail(gmail_sender_email, email_to, message.as_string())
-
-        logger.info("Email sent successfully via SMTP %s:%s (SSL=%s)", smtp_server, smtp_port, smtp_use_ssl)
-        return True
-    except smtplib.SMTPAuthenticationError:
-        logger.error("SMTP authentication failed. Check credentials and SMTP settings.")
-        return False
-    except Exception as e:
-        logger.error("An error occurred while sending email via SMTP %s:%s (SSL=%s): %s", smtp_server, smtp_port, smtp_use_ssl, e)
-        return False
+                    self._send_locked(message, email_to)
+                except smtplib.SMTPServerDisconnected:
+                    # Connection went stale between files; retry once on a fresh one
+                    self.close()
+                    self._send_locked(message, email_to)
+                logger.info("Email sent successfully via SMTP %s:%s (SSL=%s)", self.smtp_server, self.smtp_port, self.smtp_use_ssl)
+                return True
+            except smtplib.SMTPAuthenticationError:
+                self.close()
+                logger.error("SMTP authentication failed. Check credentials and SMTP settings.")
+                return False
+            except Exception as e:
+                self.close()
+                logger.error("An error occurred while sending email via SMTP %s:%s (SSL=%s): %s", self.smtp_server, self.smtp_port, self.smtp_use_ssl, e)
+                return False
+
+
+def send_transcription_email(
+    gmail_app_password: str | None,
+    gmail_sender_email: str | None,
+    email_to: str | None,
+    subject: str,
+    body_text: str,
+    attachment_path: str | None,
+    *,
+    config: Config | None = None,
+):
+    """Send a single transcription email over a one-off SMTP connection.
+
+    Kept for existing callers; batches should share a ``GmailSender`` so the
+    TLS handshake and login happen once.
+    """
+    with GmailSender(gmail_sender_email, gmail_app_password, config=config) as sender:
+        return sender.send(email_to, subject, body_text, attachment_path)
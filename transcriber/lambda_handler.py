@@ -1,9 +1,11 @@
 """AWS Lambda entry point."""
 from __future__ import annotations
 import asyncio
+from . import configure_logging
 from .runner import run
 
 
 def lambda_handler(event, context):
     """Lambda handler wraps async run logic."""
+    configure_logging()
     return asyncio.run(run())
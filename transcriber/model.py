@@ -2,12 +2,28 @@
 from __future__ import annotations
 import os
 import re
+import random
 import asyncio
+import contextlib
+import itertools
 import subprocess
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from .utils import clean_some_unicode_from_text
+from . import logger
+
+# Imported at module load so Lambda's init phase absorbs the cost; the
+# dependency is only required once a model is actually loaded.
+try:
+    import ivrit
+except ImportError:  # pragma: no cover - exercised only without the dependency
+    ivrit = None
 
 PAYLOAD_ERR_RE = re.compile(r"Payload length is (\d+), exceeding max payload length of (\d+)")
+SEGMENT_NAME_RE = re.compile(r"seg\d{3}\.mp3")
+BACKOFF_CAP_S = 8.0
+
+# Constructed RunPod model clients per (api_key, endpoint_id, model_name, language); reused on warm invocations
+_MODEL_CACHE: Dict[Tuple[str, str, str, str], Any] = {}
 
 
 def _format_ts(seconds: float) -> str:
@@ -27,6 +43,29 @@ def _probe_duration(path: str) -> float:
         return 0.0
 
 
+async def _probe_duration_async(path: str) -> float:
+    """Non-blocking ffprobe duration lookup; returns 0.0 on any failure."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error", "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1", path,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+        )
+        out, _ = await proc.communicate()
+        return float(out.decode().strip())
+    except Exception:
+        return 0.0
+
+
+async def _probe_durations(paths: List[str]) -> List[float]:
+    """Probe many files concurrently (bounded) without blocking the event loop."""
+    sem = asyncio.Semaphore(max(4, os.cpu_count() or 1))
+    async def _one(p: str) -> float:
+        async with sem:
+            return await _probe_duration_async(p)
+    return list(await asyncio.gather(*[_one(p) for p in paths]))
+
+
 def _encode_slice(src: str, dst: str, start: float, dur: float):
     subprocess.check_call([
         "ffmpeg", "-y", "-ss", f"{start:.3f}", "-t", f"{dur:.3f}", "-i", src,
@@ -34,34 +73,41 @@ def _encode_slice(src: str, dst: str, start: float, dur: float):
     ], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
 
 
-async def transcribe_segment(model, segment_path: str, index: int, start_s: float, end_s: float, max_retries: int, payload_size_cap: int) -> Dict[str, Any]:
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff (1, 2, 4, ... capped at BACKOFF_CAP_S) with +/-25% jitter."""
+    return min(2 ** (attempt - 1), BACKOFF_CAP_S) * (0.75 + 0.5 * random.random())
+
+
+async def transcribe_segment(model, segment_path: str, index: int, start_s: float, end_s: float, max_retries: int, payload_size_cap: int, sem: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
     """Transcribe a single segment (async). Signals split on payload error pattern.
 
-    Retries performed with simple linear backoff using asyncio.sleep.
+    Retries use capped exponential backoff with jitter. When ``sem`` is given it
+    is held only for each attempt, so the backoff sleep does not block a slot.
     """
     attempts = max_retries + 1
     last_error = None
     for attempt in range(1, attempts + 1):
-        try:
-            print(f"Transcribing segment {index} attempt {attempt}/{attempts}: {segment_path}")
-            segs = model.transcribe_async(path=segment_path, diarize=True)
-            collected: List[str] = []
-            async for s in segs:
-                collected.append(clean_some_unicode_from_text(getattr(s, 'text', str(s))))
-            text = "\n".join(collected).strip()
-            if text:
-                return {"index": index, "text": text, "start_s": start_s, "end_s": end_s}
-            last_error = "empty transcription"
-        except Exception as e:
-            msg = str(e)
-            m = PAYLOAD_ERR_RE.search(msg)
-            if m:
-                print(f"Payload error detected for segment {index}: {msg}. Marking for split.")
-                return {"index": index, "split_required": True, "segment_path": segment_path, "start_s": start_s, "end_s": end_s}
-            last_error = msg
-            print(f"Error segment {index} attempt {attempt}: {msg}")
+        async with (sem or contextlib.nullcontext()):
+            try:
+                logger.debug("Transcribing segment %d attempt %d/%d: %s", index, attempt, attempts, segment_path)
+                segs = model.transcribe_async(path=segment_path, diarize=True)
+                collected: List[str] = []
+                async for s in segs:
+                    collected.append(clean_some_unicode_from_text(getattr(s, 'text', str(s))))
+                text = "\n".join(collected).strip()
+                if text:
+                    return {"index": index, "text": text, "start_s": start_s, "end_s": end_s}
+                last_error = "empty transcription"
+            except Exception as e:
+                msg = str(e)
+                m = PAYLOAD_ERR_RE.search(msg)
+                if m:
+                    logger.info("Payload error detected for segment %d: %s. Marking for split.", index, msg)
+                    return {"index": index, "split_required": True, "segment_path": segment_path, "start_s": start_s, "end_s": end_s}
+                last_error = msg
+                logger.warning("Error segment %d attempt %d: %s", index, attempt, msg)
         if attempt < attempts:
-            await asyncio.sleep(attempt)  # linear backoff
+            await asyncio.sleep(_backoff_delay(attempt))
     placeholder = f"[Transcription failed - {_format_ts(start_s)} - {_format_ts(end_s)} Reason: {last_error or 'unknown'}]"
     return {"index": index, "text": placeholder, "start_s": start_s, "end_s": end_s}
 
@@ -81,48 +127,53 @@ async def _recursive_split_and_transcribe(model, path: str, start_s: float, end_
             term = {"index": start_s, "text": placeholder, "start_s": start_s, "end_s": end_s}
         results.append(term)
         return results
-    dur = _probe_duration(path) or (end_s - start_s) or 1.0
+    # ffprobe/ffmpeg block; run them in threads so other files' work keeps flowing
+    dur = await asyncio.to_thread(_probe_duration, path) or (end_s - start_s) or 1.0
     half = dur / 2.0
     left_path = f"{path}_partL.mp3"; right_path = f"{path}_partR.mp3"
-    _encode_slice(path, left_path, 0.0, half)
-    _encode_slice(path, right_path, half, dur - half)
+    await asyncio.to_thread(_encode_slice, path, left_path, 0.0, half)
+    await asyncio.to_thread(_encode_slice, path, right_path, half, dur - half)
     left_res = await _recursive_split_and_transcribe(model, left_path, start_s, start_s + half, depth + 1, max_depth, payload_size_cap, max_retries)
     right_res = await _recursive_split_and_transcribe(model, right_path, start_s + half, end_s, depth + 1, max_depth, payload_size_cap, max_retries)
     return left_res + right_res
 
 
-async def transcribe_file(model, mp3_full_path: str, work_dir: str, seg_seconds: int, max_concurrency: int, bypass_split: bool, splitter_fn, max_segment_retries: int, max_payload_size: int, max_split_depth: int):
+async def transcribe_file(model, mp3_full_path: str, work_dir: str, seg_seconds: int, max_concurrency: int, bypass_split: bool, splitter_fn, max_segment_retries: int, max_payload_size: int, max_split_depth: int, durations: Optional[List[float]] = None):
     """Transcribe file; split segments recursively on payload errors.
 
     Parameters kept minimal to avoid broad refactors. Size-based splitting only triggered by payload error.
+    Segment durations come from ``durations`` or the splitter's return value when
+    available (one per segment); otherwise each segment is probed with ffprobe.
     """
     out_pattern = os.path.join(work_dir, "seg%03d.mp3")
-    if bypass_split:
-        segments = [f for f in os.listdir(work_dir) if re.match(r"seg\d{3}\.mp3", f)]
-    else:
-        splitter_fn(mp3_full_path, out_pattern, seg_seconds)
-        segments = [f for f in os.listdir(work_dir) if re.match(r"seg\d{3}\.mp3", f)]
-    segments.sort()
+    if not bypass_split:
+        # Splitting shells out to ffmpeg; keep it off the event loop
+        split_durations = await asyncio.to_thread(splitter_fn, mp3_full_path, out_pattern, seg_seconds)
+        if isinstance(split_durations, list):
+            durations = split_durations
+    segments = sorted(f for f in os.listdir(work_dir) if SEGMENT_NAME_RE.match(f))
     if not segments:
         return "", []
-    starts: List[float] = []
-    ends: List[float] = []
-    cursor = 0.0
-    for fname in segments:
-        p = os.path.join(work_dir, fname)
-        d = _probe_duration(p) or float(seg_seconds)
-        starts.append(cursor); cursor += d; ends.append(cursor)
+    if durations is None or len(durations) != len(segments):
+        durations = await _probe_durations([os.path.join(work_dir, f) for f in segments])
+    # Prefix sums of the durations (unknown ones fall back to seg_seconds)
+    ends: List[float] = list(itertools.accumulate(d or float(seg_seconds) for d in durations))
+    starts: List[float] = [0.0] + ends[:-1]
     sem = asyncio.Semaphore(max_concurrency)
     async def _run(idx: int, fname: str):
-        async with sem:
-            seg_path = os.path.join(work_dir, fname)
-            return await transcribe_segment(model, seg_path, idx, starts[idx], ends[idx], max_segment_retries, max_payload_size)
-    base_results = await asyncio.gather(*[asyncio.create_task(_run(i, f)) for i, f in enumerate(segments)])
+        seg_path = os.path.join(work_dir, fname)
+        return await transcribe_segment(model, seg_path, idx, starts[idx], ends[idx], max_segment_retries, max_payload_size, sem=sem)
+    if len(segments) == 1:
+        # Single segment: await inline, no task/gather scheduling needed
+        base_results = [await _run(0, segments[0])]
+    else:
+        # gather wraps coroutines in tasks itself; no extra create_task layer
+        base_results = await asyncio.gather(*[_run(i, f) for i, f in enumerate(segments)])
     expanded: List[Dict[str, Any]] = []
     for res in base_results:
         if res.get("split_required"):
             s = res["start_s"]; e = res["end_s"]
-            print(f"Starting recursive split for segment index={res['index']} range {s:.2f}-{e:.2f}s")
+            logger.info("Starting recursive split for segment index=%s range %.2f-%.2fs", res['index'], s, e)
             expanded.extend(await _recursive_split_and_transcribe(model, res["segment_path"], s, e, depth=0, max_depth=max_split_depth, payload_size_cap=max_payload_size, max_retries=max_segment_retries))
         else:
             expanded.append(res)
@@ -134,12 +185,19 @@ async def transcribe_file(model, mp3_full_path: str, work_dir: str, seg_seconds:
 def load_model(runpod_api_key: str | None, runpod_endpoint_id: str | None, languages_cfg: Dict[str, Any], language: str = "he"):
     if not runpod_api_key or not runpod_endpoint_id:
         raise RuntimeError("RUNPOD_API_KEY or RUNPOD_ENDPOINT_ID not set.")
-    import ivrit
+    if ivrit is None:
+        raise RuntimeError("ivrit package is not installed.")
     lang_cfg = languages_cfg.get(language)
     if not lang_cfg:
         raise RuntimeError(f"Language '{language}' not found in config.")
     model_name = lang_cfg.get("model")
     if not model_name:
         raise RuntimeError(f"Model not configured for language '{language}'.")
-    print(f"Loading model '{model_name}' for language '{language}' via RunPod endpoint {runpod_endpoint_id}...")
-    return ivrit.load_model(engine='runpod', model=model_name, api_key=runpod_api_key, endpoint_id=runpod_endpoint_id, core_engine='stable-whisper')
\ No newline at end of file
+    key = (runpod_api_key, runpod_endpoint_id, model_name, language)
+    cached = _MODEL_CACHE.get(key)
+    if cached is not None:
+        return cached
+    logger.info("Loading model '%s' for language '%s' via RunPod endpoint %s...", model_name, language, runpod_endpoint_id)
+    model = ivrit.load_model(engine='runpod', model=model_name, api_key=runpod_api_key, endpoint_id=runpod_endpoint_id, core_engine='stable-whisper')
+    _MODEL_CACHE[key] = model
+    return model
\ No newline at end of file
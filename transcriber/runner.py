@@ -1,11 +1,14 @@
 """Orchestrator logic for end-to-end processing of Drive audio files."""
 from __future__ import annotations
 import os
+import shutil
+import time
 import tempfile
 import asyncio
+import contextlib
 import json
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from .config import load_config, Config
 from .drive import (
@@ -15,22 +18,44 @@ from .drive import (
     get_or_create_processed_folder,
     move_file_to_folder,
 )
-from .audio import convert_to_mp3, split_mp3_by_size  # size-based splitter
+from .audio import convert_to_mp3, convert_and_split, fused_segment_seconds, split_mp3_by_size  # size-based splitter
 from .model import load_model, transcribe_file
-from .emailer import send_transcription_email
+from .emailer import GmailSender
 from .utils import sanitize_filename, generate_positive_personal_message
 
 import aiohttp
-from . import logger
+from . import logger, configure_logging
 
 TEMP_DIR = os.path.join(tempfile.gettempdir(), "drive_work")
+EMAIL_PREVIEW_CHARS = 5000  # transcript excerpt included in the email body
 os.makedirs(TEMP_DIR, exist_ok=True)
 
 
-async def fetch_runpod_balance(api_key: str | None) -> Optional[Dict[str, Any]]:
-    """Fetch RunPod account balance via GraphQL; returns None on error."""
+# Short-lived balance snapshots per API key
+_BALANCE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+BALANCE_CACHE_TTL_S = 30.0
+
+
+def _new_http_session() -> aiohttp.ClientSession:
+    """ClientSession for RunPod API calls; the caller owns it and must close it."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=15),
+    )
+
+
+async def fetch_runpod_balance(api_key: str | None, session: Optional[aiohttp.ClientSession] = None) -> Optional[Dict[str, Any]]:
+    """Fetch RunPod account balance via GraphQL; returns None on error.
+
+    Pass ``session`` to reuse a connection pool across calls; otherwise a
+    temporary session is opened and closed. Successful results are reused for
+    BALANCE_CACHE_TTL_S seconds so files processed back-to-back share one snapshot.
+    """
     if not api_key:
         return None
+    cached = _BALANCE_CACHE.get(api_key)
+    if cached and time.monotonic() - cached[0] < BALANCE_CACHE_TTL_S:
+        return cached[1]
     GRAPHQL_URL = "https://api.runpod.io/graphql"
     headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
     query = """
@@ -43,19 +68,22 @@ async def fetch_runpod_balance(api_key: str | None) -> Optional[Dict[str, Any]]:
     }
     """
     try:
-        timeout = aiohttp.ClientTimeout(total=15)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with contextlib.AsyncExitStack() as stack:
+            if session is None:
+                session = await stack.enter_async_context(_new_http_session())
             async with session.post(GRAPHQL_URL, headers=headers, json={"query": query}) as resp:
                 resp.raise_for_status()
                 data = await resp.json()
                 if "errors" in data:
                     return None
                 myself: dict = data.get("data", {}).get("myself", {})
-                return {
+                balance = {
                     "clientBalance": myself.get("clientBalance"),
                     "currentSpendPerHr": myself.get("currentSpendPerHr"),
                     "spendLimit": myself.get("spendLimit"),
                 }
+                _BALANCE_CACHE[api_key] = (time.monotonic(), balance)
+                return balance
     except Exception:
         return None
 
@@ -91,120 +119,163 @@ async def process_drive_files(cfg: Config) -> Dict[str, Any]:
     except Exception as e:
         return {"error": "model_load_failed", "detail": str(e)}
 
-    initial_balance = await fetch_runpod_balance(cfg.runpod_api_key)
-    summaries: List[Dict[str, Any]] = []
-    for f in files:
-        fid = f.get("id")
-        name = f.get("name")
-        created = f.get("createdTime")
-        if created:
-            dt = datetime.fromisoformat(created.replace("Z", "+00:00")).astimezone(timezone.utc)
-        else:
-            dt = datetime.now(timezone.utc)
-        ts_dir_name = dt.strftime("%Y-%m-%d_%H-%M")
-        work_dir = os.path.join(TEMP_DIR, fid)
-        os.makedirs(work_dir, exist_ok=True)
-        audio_input_path = os.path.join(work_dir, name)  # original downloaded file
-        mp3_full = os.path.join(work_dir, os.path.splitext(name)[0] + ".mp3")
-        try:
-            download_file(drive_svc, fid, audio_input_path, cfg.skip_drive)
-        except Exception as e:
-            logger.error("Download failed %s: %s", fid, e)
-            summaries.append({"id": fid, "name": name, "error": f"download_failed: {e}"})
-            continue
-        try:
-            convert_to_mp3(audio_input_path, mp3_full)
-        except Exception as e:
-            logger.error("Conversion failed %s: %s", name, e)
-            summaries.append({"id": fid, "name": name, "error": f"conversion_failed: {e}"})
-            continue
+    # One HTTP session for every RunPod API call in this run, closed on exit
+    async with _new_http_session() as http:
+        return await _process_files(cfg, files, drive_svc, model, processed_folder_id, http)
 
-        def splitter_callable(src: str, pattern: str, seg_secs: int, max_segment_size: int = cfg.max_segment_size) -> None:
-            """Wrapper preserving expected arg order for transcribe_file splitter."""
-            return split_mp3_by_size(src, pattern, max_segment_size, seg_secs)
-        try:
-            full_text, segments = await transcribe_file(
-                model,
-                mp3_full_path=mp3_full,
-                work_dir=work_dir,
-                seg_seconds=cfg.seg_seconds,
-                max_concurrency=cfg.max_segment_concurrency,
-                bypass_split=cfg.bypass_split,
-                splitter_fn=splitter_callable,
-                max_segment_retries=cfg.max_segment_retries,
-                max_payload_size=cfg.max_payload_size,
-                max_split_depth=cfg.max_split_depth,
+
+async def _process_files(
+    cfg: Config,
+    files: List[Dict[str, Any]],
+    drive_svc,
+    model,
+    processed_folder_id: str,
+    http: aiohttp.ClientSession,
+) -> Dict[str, Any]:
+    """Run every file through _process_drive_file, sharing one mailer and HTTP session."""
+    initial_balance = await fetch_runpod_balance(cfg.runpod_api_key, http)
+    # Files run concurrently (bounded); blocking Drive/ffmpeg/SMTP work goes to threads.
+    # The Drive client is not thread-safe, so Drive calls are serialized by a lock.
+    file_sem = asyncio.Semaphore(max(1, cfg.max_file_concurrency))
+    drive_lock = asyncio.Lock()
+
+    # One SMTP session (TLS handshake + login) shared by every file in the batch
+    with GmailSender(cfg.gmail_sender_email, cfg.gmail_app_password, config=cfg) as mailer:
+        async def _process_one(f: Dict[str, Any]) -> Dict[str, Any]:
+            async with file_sem:
+                return await _process_drive_file(cfg, f, drive_svc, drive_lock, mailer, model, processed_folder_id, initial_balance, http)
+
+        summaries: List[Dict[str, Any]] = list(await asyncio.gather(*[_process_one(f) for f in files]))
+    return {"processed": summaries, "total_files": len(summaries)}
+
+
+async def _process_drive_file(
+    cfg: Config,
+    f: Dict[str, Any],
+    drive_svc,
+    drive_lock: asyncio.Lock,
+    mailer: GmailSender,
+    model,
+    processed_folder_id: str,
+    initial_balance: Optional[Dict[str, Any]],
+    http: Optional[aiohttp.ClientSession] = None,
+) -> Dict[str, Any]:
+    """Download, transcribe, email and archive a single Drive file; returns its summary."""
+    fid = f.get("id")
+    name = f.get("name")
+    created = f.get("createdTime")
+    if created:
+        dt = datetime.fromisoformat(created.replace("Z", "+00:00")).astimezone(timezone.utc)
+    else:
+        dt = datetime.now(timezone.utc)
+    ts_dir_name = dt.strftime("%Y-%m-%d_%H-%M")
+    work_dir = os.path.join(TEMP_DIR, fid)
+    os.makedirs(work_dir, exist_ok=True)
+    audio_input_path = os.path.join(work_dir, name)  # original downloaded file
+    mp3_full = os.path.join(work_dir, os.path.splitext(name)[0] + ".mp3")
+    try:
+        async with drive_lock:
+            await asyncio.to_thread(download_file, drive_svc, fid, audio_input_path, cfg.skip_drive)
+    except Exception as e:
+        logger.error("Download failed %s: %s", fid, e)
+        return {"id": fid, "name": name, "error": f"download_failed: {e}"}
+    # Opt-in: encode and segment non-MP3 inputs in one ffmpeg pass. The default
+    # converts first so split_mp3_by_size can use the real bitrate (and keep
+    # files under MAX_SEGMENT_SIZE as a single segment).
+    fused = cfg.fused_convert_split and not cfg.bypass_split and not name.lower().endswith(".mp3")
+    durations: Optional[List[float]] = None
+    try:
+        if fused:
+            durations = await asyncio.to_thread(
+                convert_and_split,
+                audio_input_path,
+                os.path.join(work_dir, "seg%03d.mp3"),
+                fused_segment_seconds(cfg.max_segment_size, cfg.seg_seconds),
             )
-        except Exception as e:
-            logger.error("Transcription failed %s: %s", name, e)
-            summaries.append({"id": fid, "name": name, "error": f"transcription_failed: {e}"})
-            continue
-        balance_info = await fetch_runpod_balance(cfg.runpod_api_key) or initial_balance
-        balance_val = balance_info.get("clientBalance") if balance_info else "N/A"
-        spend_hr_val = balance_info.get("currentSpendPerHr") if balance_info else "N/A"
-        limit_val = balance_info.get("spendLimit") if balance_info else "N/A"
-        balance_str = str(balance_val)
-        spend_hr = str(spend_hr_val)
-        limit_str = str(limit_val)
-        base_name_raw = os.path.splitext(name)[0]
-        base_name = sanitize_filename(base_name_raw)
-        transcription_filename = f"{base_name}_transcription.txt"
-        transcription_path = os.path.join(work_dir, transcription_filename)
-        try:
-            with open(transcription_path, 'w', encoding='utf-8') as tf:
-                tf.write(full_text)
-        except Exception as e:
-            logger.error("Failed to write transcription file %s: %s", transcription_filename, e)
-        email_subject_balance_part = str(balance_str)
-        low_balance_suffix = ""
-        try:
-            bal_f = float(balance_str)
-            if bal_f < cfg.balance_alert_value:
-                low_balance_suffix = " LOW BALANCE!"
-        except Exception:
-            pass
-        email_subject = f"Transcription: {base_name} (Balance: {email_subject_balance_part}{low_balance_suffix})"
-        personal_prefix = ""
-        if cfg.add_random_personal_message:
-            try:
-                personal_prefix = generate_positive_personal_message(cfg.email_to) + "\n\n"
-            except Exception as e:
-                logger.error("Failed to generate personal message: %s", e)
-                personal_prefix = ""
-        email_body_main = (
-            f"Transcription for file {name} (segments: {len(segments)})\n"
-            f"Timestamp folder: {ts_dir_name}\n"
-            f"RunPod Balance: {balance_str} | Spend/hr: {spend_hr} | Limit: {limit_str}\n\n"
-            f"{full_text[:5000]}\n\n"
-            f"--\nRemaining RunPod balance after this transcription: {balance_str}"
-        )
-        email_body = personal_prefix + email_body_main
-        email_sent = send_transcription_email(
-            cfg.gmail_app_password,
-            cfg.gmail_sender_email,
-            cfg.email_to,
-            email_subject,
-            email_body,
-            transcription_path
+        else:
+            await asyncio.to_thread(convert_to_mp3, audio_input_path, mp3_full)
+    except Exception as e:
+        logger.error("Conversion failed %s: %s", name, e)
+        return {"id": fid, "name": name, "error": f"conversion_failed: {e}"}
+
+    def splitter_callable(src: str, pattern: str, seg_secs: int, max_segment_size: int = cfg.max_segment_size):
+        """Wrapper preserving expected arg order for transcribe_file splitter."""
+        return split_mp3_by_size(src, pattern, max_segment_size, seg_secs)
+    try:
+        full_text, segments = await transcribe_file(
+            model,
+            mp3_full_path=mp3_full,
+            work_dir=work_dir,
+            seg_seconds=cfg.seg_seconds,
+            max_concurrency=cfg.max_segment_concurrency,
+            bypass_split=cfg.bypass_split or fused,
+            splitter_fn=splitter_callable,
+            max_segment_retries=cfg.max_segment_retries,
+            max_payload_size=cfg.max_payload_size,
+            max_split_depth=cfg.max_split_depth,
+            durations=durations,
         )
-        move_file_to_folder(drive_svc, fid, processed_folder_id, cfg.drive_folder_id, cfg.skip_drive)
+    except Exception as e:
+        logger.error("Transcription failed %s: %s", name, e)
+        return {"id": fid, "name": name, "error": f"transcription_failed: {e}"}
+    balance_info = await fetch_runpod_balance(cfg.runpod_api_key, http) or initial_balance
+    balance_val = balance_info.get("clientBalance") if balance_info else "N/A"
+    spend_hr_val = balance_info.get("currentSpendPerHr") if balance_info else "N/A"
+    limit_val = balance_info.get("spendLimit") if balance_info else "N/A"
+    balance_str = str(balance_val)
+    spend_hr = str(spend_hr_val)
+    limit_str = str(limit_val)
+    base_name_raw = os.path.splitext(name)[0]
+    base_name = sanitize_filename(base_name_raw)
+    transcription_filename = f"{base_name}_transcription.txt"
+    transcription_path = os.path.join(work_dir, transcription_filename)
+    try:
+        with open(transcription_path, 'w', encoding='utf-8') as tf:
+            tf.write(full_text)
+    except Exception as e:
+        logger.error("Failed to write transcription file %s: %s", transcription_filename, e)
+    low_balance_suffix = ""
+    try:
+        # Numeric balances need no str -> float round trip
+        bal_f = float(balance_val) if isinstance(balance_val, (int, float)) else float(balance_str)
+        if bal_f < cfg.balance_alert_value:
+            low_balance_suffix = " LOW BALANCE!"
+    except Exception:
+        pass
+    email_subject = f"Transcription: {base_name} (Balance: {balance_str}{low_balance_suffix})"
+    personal_prefix = ""
+    if cfg.add_random_personal_message:
         try:
-            for p in os.listdir(work_dir):
-                try:
-                    os.remove(os.path.join(work_dir, p))
-                except Exception:
-                    pass
-            os.rmdir(work_dir)
-        except Exception:
-            pass
-        summaries.append({
-            "id": fid,
-            "name": name,
-            "segments": len(segments),
-            "email_sent": email_sent,
-            "balance": balance_str,
-        })
-    return {"processed": summaries, "total_files": len(summaries)}
+            personal_prefix = generate_positive_personal_message(cfg.email_to) + "\n\n"
+        except Exception as e:
+            logger.error("Failed to generate personal message: %s", e)
+            personal_prefix = ""
+    preview = full_text if len(full_text) <= EMAIL_PREVIEW_CHARS else full_text[:EMAIL_PREVIEW_CHARS]
+    email_body_main = (
+        f"Transcription for file {name} (segments: {len(segments)})\n"
+        f"Timestamp folder: {ts_dir_name}\n"
+        f"RunPod Balance: {balance_str} | Spend/hr: {spend_hr} | Limit: {limit_str}\n\n"
+        f"{preview}\n\n"
+        f"--\nRemaining RunPod balance after this transcription: {balance_str}"
+    )
+    email_body = personal_prefix + email_body_main
+    email_sent = await asyncio.to_thread(
+        mailer.send,
+        cfg.email_to,
+        email_subject,
+        email_body,
+        transcription_path
+    )
+    async with drive_lock:
+        await asyncio.to_thread(move_file_to_folder, drive_svc, fid, processed_folder_id, cfg.drive_folder_id, cfg.skip_drive)
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        "id": fid,
+        "name": name,
+        "segments": len(segments),
+        "email_sent": email_sent,
+        "balance": balance_str,
+    }
 
 
 async def run() -> Dict[str, Any]:
@@ -214,6 +285,7 @@ async def run() -> Dict[str, Any]:
 
 
 def main() -> Dict[str, Any]:
+    configure_logging()
     logger.info("Starting scheduled Drive transcription run (local CLI)...")
     result = asyncio.run(run())
     logger.info("Run result:\n%s", json.dumps(result, indent=2, ensure_ascii=False))
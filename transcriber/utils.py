@@ -1,18 +1,48 @@
+"""Utility helpers (text cleaning, etc.)."""
+import functools
 import random
-from datetime import datetime
+import re
+import time
+import types
+
+# Windows-reserved filename characters and ASCII control characters
+_RESERVED_CHARS = '<>:"/\\|?*'
+_RESERVED_RE = re.compile(r'[<>:"/\\|?*]+')
+_CTRL_TRANS = dict.fromkeys([*range(0x20), 0x7F], None)
+# Default replacement '_': reserved -> '_' and control chars dropped in a single translate
+_DEFAULT_TRANS = {**{ord(c): "_" for c in _RESERVED_CHARS}, **_CTRL_TRANS}
+_COLLAPSE_UNDER = re.compile(r'_{2,}')
+
+
+@functools.lru_cache(maxsize=8)
+def _reserved_trans(replacement: str) -> dict:
+    """str.translate table mapping each reserved character to a single-char ``replacement``."""
+    return {ord(c): replacement for c in _RESERVED_CHARS}
+
+
+@functools.lru_cache(maxsize=8)
+def _collapse_re(replacement: str) -> re.Pattern:
+    """Compiled pattern matching 2+ consecutive ``replacement`` strings (cached per replacement)."""
+    return re.compile('(?:' + re.escape(replacement) + '){2,}')
+
+
+# Bidi/zero-width codepoints removed from transcribed text
+_UNICODE_STRIP_TABLE = str.maketrans('', '', (
+    "\u061C"  # Arabic letter mark
+    "\u200B\u200C\u200D"  # Zero-width space, non/ joiner
+    "\u200E\u200F"  # LTR/RTL marks
+    "\u202A\u202B\u202C\u202D\u202E"  # embeddings/overrides
+    "\u2066\u2067\u2068\u2069"  # isolate controls
+    "\uFEFF"  # zero-width no-break space
+))
 
-"""Utility helpers (text cleaning, etc.)."""
 
 def clean_some_unicode_from_text(text: str) -> str:
-    chars_to_remove = "\u061C"  # Arabic letter mark
-    chars_to_remove += "\u200B\u200C\u200D"  # Zero-width space, non/ joiner
-    chars_to_remove += "\u200E\u200F"  # LTR/RTL marks
-    chars_to_remove += "\u202A\u202B\u202C\u202D\u202E"  # embeddings/overrides
-    chars_to_remove += "\u2066\u2067\u2068\u2069"  # isolate controls
-    chars_to_remove += "\uFEFF"  # zero-width no-break space
-    return text.translate({ord(c): None for c in chars_to_remove})
+    # Every stripped codepoint is non-ASCII, and isascii() is O(1) on CPython
+    return text if text.isascii() else text.translate(_UNICODE_STRIP_TABLE)
 
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(name: str, replacement: str = "_") -> str:
     """Sanitize a filename (without path). Keeps Unicode letters/digits, replaces unsafe chars.
 
@@ -20,84 +50,122 @@ def sanitize_filename(name: str, replacement: str = "_") -> str:
     Also trims whitespace and collapses repeats of the replacement.
     Falls back to 'file' if the cleaned base is empty or composed solely of replacement characters.
     """
-    import re
     # Remove path components just in case
-    base = name.split('/')[-1].split('\\')[-1]
-    # Replace reserved characters
-    base = re.sub(r'[<>:"/\\|?*]+', replacement, base)
-    # Remove control characters
-    base = re.sub(r'[\x00-\x1F\x7F]+', '', base)
-    # Collapse multiple replacements
-    base = re.sub(rf'{re.escape(replacement)}{{2,}}', replacement, base)
+    base = name.rpartition('/')[2].rpartition('\\')[2]
+    # Fast path: a name the steps below would leave untouched is returned as-is
+    # (isprintable() rules out control chars; anything doubtful takes the full path)
+    if (0 < len(base) <= 200 and base.isprintable() and base == base.strip(' .')
+            and _RESERVED_RE.search(base) is None and replacement * 2 not in base
+            and base.count(replacement) != len(base)):
+        return base
+    # Bound the work on pathological inputs; slack covers collapse/strip shrinkage
+    if len(base) > 400:
+        base = base[:400]
+    if replacement == "_":
+        # Common case: one translate pass, then collapse runs of '_'
+        base = _COLLAPSE_UNDER.sub('_', base.translate(_DEFAULT_TRANS))
+    else:
+        # Replace reserved characters (runs are collapsed below)
+        if len(replacement) == 1:
+            base = base.translate(_reserved_trans(replacement))
+        else:
+            base = _RESERVED_RE.sub(replacement, base)
+        # Remove control characters
+        base = base.translate(_CTRL_TRANS)
+        # Collapse multiple replacements
+        base = _collapse_re(replacement).sub(replacement, base)
     # Strip leading/trailing dots and spaces (Windows quirk)
     base = base.strip(' .')
     # Fallback if empty or only replacement characters
-    if not base or set(base) == {replacement}:
+    if not base or base.count(replacement) == len(base):
         base = 'file'
     return base[:200]  # limit length
 
 
+# Building blocks for generate_positive_personal_message (allocated once)
+_RNG = random.Random()
+_GREETINGS = ("Hey", "Hi", "Hello", "Hey there", "Greetings")
+_ENERGY_PHRASES = (
+    "May your focus feel light and steady today.",
+    "Wishing you pockets of clarity and sparks of curiosity.",
+    "Here's to smooth progress and zero friction moments.",
+    "May momentum find you exactly when you need it.",
+    "Let creative neurons fire in friendly sequence.",
+)
+_BOOSTS_POOL = (
+    "A dash of calm", "a splash of motivation", "gentle sustained energy",
+    "insight that arrives just in time", "solid breakthroughs", "refreshing mini-pauses",
+    "nicely aligned priorities", "confident decisions", "quiet wins", "useful serendipity",
+)
+# Time-of-day phrase per UTC hour
+_TOD_BY_HOUR = ("early hours",) * 6 + ("morning",) * 6 + ("afternoon",) * 5 + ("evening",) * 7
+_BOOST_STARTERS = ("May you get", "Wishing you", "May today bring", "Here's to")
+_CLOSINGS = (
+    "Keep going — you're doing great!", "Onward with good vibes!", "Have an excellent rest of your day!",
+    "Sending a pulse of encouragement your way!", "Rooting for your progress!",
+)
+# All pools behind one global so the hot function binds them with a single lookup
+_POOLS = types.SimpleNamespace(
+    greetings=_GREETINGS,
+    energy=_ENERGY_PHRASES,
+    boosts=_BOOSTS_POOL,
+    starters=_BOOST_STARTERS,
+    closings=_CLOSINGS,
+)
+# greeting / energy / boosts / closing, one per line
+_MSG_TMPL = "{}\n{}\n{}\n{}".format
+
+
+# [epoch minute, phrase] of the last time-of-day lookup
+_TOD_CACHE = [-1, ""]
+
+
+def _tod() -> str:
+    """Time-of-day phrase for the current UTC hour, recomputed at most once a minute."""
+    m = int(time.time() // 60)
+    if m != _TOD_CACHE[0]:
+        _TOD_CACHE[0] = m
+        _TOD_CACHE[1] = _TOD_BY_HOUR[(m // 60) % 24]
+    return _TOD_CACHE[1]
+
+
+# Anything other than word characters (str.isalnum() + '_'), '.' and '-'
+_NICK_STRIP_RE = re.compile(r'[^\w.\-]')
+
+
+@functools.lru_cache(maxsize=256)
+def _nickname(email: str) -> str:
+    """Derive a short display nickname from an email address (local part, safe chars only)."""
+    return _NICK_STRIP_RE.sub('', email.split('@', 1)[0][:25])
+
+
 def generate_positive_personal_message(recipient: str | None = None) -> str:
     """Generate a short upbeat personal message by composing multiple random parts.
 
     The message is built from: greeting + energy phrase + 2-3 shuffled boosts + closing.
     Ensures personalization appears when a recipient is provided.
     """
-    now = datetime.utcnow()
-    hour = now.hour
-    if hour < 6:
-        tod = "early hours"
-    elif hour < 12:
-        tod = "morning"
-    elif hour < 17:
-        tod = "afternoon"
-    else:
-        tod = "evening"
-    greetings = [
-        f"Hey", f"Hi", f"Hello", f"Hey there", f"Greetings"
-    ]
-    nick = None
-    if recipient:
-        nick_raw = recipient.split('@')[0][:25]
-        nick = ''.join(ch for ch in nick_raw if ch.isalnum() or ch in ('_', '-', '.'))
+    tod = _tod()
+    p = _POOLS
+    rng = _RNG
+    choice = rng.choice
+    nick = _nickname(recipient) if recipient else None
     if nick:
         # Guarantee at least one personalized greeting by using it directly.
         greeting = f"Hi {nick} — hope your {tod} is going well!"
     else:
-        greeting = random.choice(greetings) + f" — hope your {tod} is going well!"
-
-    energy_phrases = [
-        "May your focus feel light and steady today.",
-        "Wishing you pockets of clarity and sparks of curiosity.",
-        "Here's to smooth progress and zero friction moments.",
-        "May momentum find you exactly when you need it.",
-        "Let creative neurons fire in friendly sequence." ,
-    ]
-    energy = random.choice(energy_phrases)
-
-    boosts_pool = [
-        "A dash of calm", "a splash of motivation", "gentle sustained energy",
-        "insight that arrives just in time", "solid breakthroughs", "refreshing mini-pauses",
-        "nicely aligned priorities", "confident decisions", "quiet wins", "useful serendipity"
-    ]
-    random.shuffle(boosts_pool)
-    boosts_selected = boosts_pool[: random.randint(2, 3)]
-    # Compose boosts into a phrase
-    if len(boosts_selected) == 1:
-        boosts_phrase = boosts_selected[0]
-    else:
-        boosts_phrase = ", ".join(boosts_selected[:-1]) + f" and {boosts_selected[-1]}"
-    boosts_sentence_starters = ["May you get", "Wishing you", "May today bring", "Here's to"]
-    boosts_sentence = random.choice(boosts_sentence_starters) + f" {boosts_phrase}."
-
-    closings = [
-        "Keep going — you're doing great!", "Onward with good vibes!", "Have an excellent rest of your day!",
-        "Sending a pulse of encouragement your way!", "Rooting for your progress!"
-    ]
-    closing = random.choice(closings)
-
-    message = f"{greeting}\n{energy}\n{boosts_sentence}\n{closing}"
-    return message
+        greeting = choice(p.greetings) + f" — hope your {tod} is going well!"
+
+    energy = choice(p.energy)
+
+    b = rng.sample(p.boosts, rng.randint(2, 3))
+    # Compose the 2 or 3 boosts into a phrase
+    boosts_phrase = f"{b[0]} and {b[1]}" if len(b) == 2 else f"{b[0]}, {b[1]} and {b[2]}"
+    boosts_sentence = choice(p.starters) + f" {boosts_phrase}."
+
+    closing = choice(p.closings)
+
+    return _MSG_TMPL(greeting, energy, boosts_sentence, closing)
 
 __all__ = [
     "clean_some_unicode_from_text",